@@ -1,24 +1,112 @@
 # src/dirmapper/ai/summarizer.py
-import copy
 import os
 from typing import List, Optional, Tuple, Dict
 from dirmapper_core.models.directory_item import DirectoryItem
 from dirmapper_core.models.directory_structure import DirectoryStructure
 from dirmapper_core.styles.tree_style import TreeStyle
-from dirmapper_core.utils.logger import logger, log_periodically, stop_logging
+from dirmapper_core.utils.logger import logger, log_periodically, log_periodically_async, stop_logging
 from dirmapper_core.writer.template_parser import TemplateParser
-from openai import OpenAI, AuthenticationError
+from openai import OpenAI, AsyncOpenAI, AuthenticationError
 from dirmapper_core.utils.paginator import DirectoryPaginator
 from dirmapper_core.utils.text_analyzer import TextAnalyzer
 from dirmapper_core.utils.cache import SummaryCache, cached_api_call
 
+import asyncio
 import json
+import logging
 import threading
 
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import httpx
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
+# gpt-4o-mini context window, less the completion budget and a cushion for the
+# fixed prompt text, gives the usable token budget per chunked request.
+_MODEL_CONTEXT_TOKENS = 128000
+_COMPLETION_TOKENS = 2048
+_PROMPT_OVERHEAD_TOKENS = 512
+
+_token_encoder = None
+_token_encoder_failed = False
+
+
+def _get_token_encoder():
+    """Return the tiktoken encoder for gpt-4o-mini, or None if unavailable."""
+    global _token_encoder, _token_encoder_failed
+    if _token_encoder is None and not _token_encoder_failed and tiktoken is not None:
+        try:
+            _token_encoder = tiktoken.encoding_for_model("gpt-4o-mini")
+        except Exception as e:
+            logger.debug(f"tiktoken encoder unavailable, falling back to character chunking: {e}")
+            _token_encoder_failed = True
+    return _token_encoder
+
 from typing import List, Dict, Any
-import time
-from ratelimit import limits, sleep_and_retry
+
+
+def _dumps_payload(obj) -> str:
+    """
+    Serialize an object for inclusion in an API prompt, without indentation.
+
+    The model does not need human-readable whitespace, and compact output both
+    serializes faster and sends fewer prompt tokens per call. Uses orjson when
+    available, falling back to the standard library.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj, separators=(',', ':'))
+
+
+# Static prompt messages, hoisted so the hot paths only build the dynamic
+# user content per request instead of re-creating the full messages list.
+_DIRECTORY_SYSTEM_MSG = {
+    "role": "system",
+    "content": "You are a directory structure analyzer. Respond only with valid JSON."
+}
+_FILE_SYSTEM_MSG = {
+    "role": "system",
+    "content": "You are a helpful assistant that summarizes file content into markdown format."
+}
+_PROJECT_SYSTEM_MSG = {
+    "role": "system",
+    "content": "You are an assistant that generates project summaries."
+}
+
+# Static instruction block for directory summarization. Kept byte-identical
+# across calls (all variable pieces are appended after it) so that when a
+# large tree is summarized in multiple chunked calls the provider's prompt
+# caching can reuse the shared prefix instead of re-processing it.
+_DIRECTORY_USER_PROMPT_PREFIX = (
+    "Analyze the directory structure provided below. "
+    "Use the JSON object that matches the input structure to generate "
+    "`short_summary` fields overwriting the existing `short_summary` field. Use the existing `short_summary` value "
+    "for additional context about the existing file if it is not labled 'Empty File'. Generate a short summary for "
+    "each folder based on the files it contains and also store this in the field `short_summary`. "
+    "Do not modify the structure in any other way.\n\n"
+)
+
+
+def _build_async_http_client() -> httpx.AsyncClient:
+    """
+    Build the httpx client backing AsyncOpenAI, tuned for high-concurrency fan-out.
+
+    The SDK default client caps the connection pool well below the number of
+    requests we issue concurrently, which serializes requests behind a small
+    pool under load. Raise the limits so batched chunk/file summaries can keep
+    the pool saturated, and keep DNS/keep-alive state warm between calls.
+    """
+    return httpx.AsyncClient(
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+        timeout=httpx.Timeout(600.0, connect=10.0)
+    )
 
 
 class DirectorySummarizer:
@@ -47,16 +135,25 @@ class DirectorySummarizer:
         """
         self.is_local = config.get('use_local', True)
         self.client = None
+        if not self.is_local:
+            api_token = config.get("api_token")
+            if not api_token:
+                raise ValueError("API token is not set. Please set the API token in the preferences.")
+            self.client = OpenAI(api_key=api_token)
         self.summarize_file_content = config.get('summarize_file_content', False)
         self.max_short_summary_characters = config.get('max_short_summary_characters', 75)
         self.max_file_summary_words = config.get('max_file_summary_words', 50)
-        self.file_summarizer = FileSummarizer(config)  # Kept this
+        # Share the sync client so both summarizers reuse one connection pool
+        self.file_summarizer = FileSummarizer(config, client=self.client)
         self.paginator = DirectoryPaginator(max_items_per_page=config.get('pagination_threshold', 50), max_tokens=4000)
-        self.exclude_files = config.get('exclude_files')
-        self.exclude_dirs = config.get('exclude_dirs')
-        self.exclude_extensions = config.get('exclude_extensions')
+        self.exclude_files = frozenset(config.get('exclude_files') or ())
+        self.exclude_dirs = frozenset(config.get('exclude_dirs') or ())
+        self.exclude_extensions = frozenset(config.get('exclude_extensions') or ())
         self.allowed_extensions = config.get('allowed_extensions', ['.py', '.md', '.txt', '.json', '.yaml', '.yml', '.toml', '.xml', '.js', '.html', '.css', '.go', '.java'])
-        self.allowed_files = config.get('allowed_files', ['README', 'MANIFEST', 'LICENSE', 'CHANGELOG', 'CONTRIBUTING', 'Makefile', 'Dockerfile'])
+        self.allowed_files = frozenset(config.get('allowed_files', ['README', 'MANIFEST', 'LICENSE', 'CHANGELOG', 'CONTRIBUTING', 'Makefile', 'Dockerfile']))
+        # Precomputed suffix tuple: str.endswith on a tuple is a single C-level
+        # scan, replacing per-file splitext + lower + list membership checks.
+        self._allowed_ext_suffixes = tuple(ext.lower() for ext in self.allowed_extensions)
         self.text_analyzer = TextAnalyzer(
             entropy_threshold=config.get('entropy_threshold', 4.0)
         )
@@ -67,12 +164,6 @@ class DirectorySummarizer:
         )
         self.concurrent_dir_summaries = config.get("concurrent_dir_summaries", 3)
 
-        if not self.is_local:
-            api_token = config.get("api_token")
-            if not api_token:
-                raise ValueError("API token is not set. Please set the API token in the preferences.")
-            self.client = OpenAI(api_key=api_token)
-
     def summarize(self, directory_structure: DirectoryStructure) -> dict:
         """
         Summarizes the directory structure using the OpenAI API or local model.
@@ -214,10 +305,14 @@ class DirectorySummarizer:
         """
         Preprocesses the directory structure to add content summaries in parallel.
         """
-        # Get all files that need summarization
+        # Get all files that need summarization. Files over the inline cap
+        # read as empty (content is None) but are still summarizable — the
+        # parallel path streams them from disk — so they must survive the
+        # empty-content filter.
         files_to_summarize = [
             item for item in structure.get_files()
-            if not self._is_empty_or_near_empty(item.content) 
+            if (not self._is_empty_or_near_empty(item.content)
+                or self._is_over_inline_cap(item))
             and self._should_summarize_file(item.path, item.content)
         ]
 
@@ -234,6 +329,24 @@ class DirectorySummarizer:
 
         logger.info(f"Completed summarizing {len(summaries)} files")
 
+    @staticmethod
+    def _is_over_inline_cap(item: DirectoryItem) -> bool:
+        """
+        Check whether an item's file exceeds the inline read cap.
+
+        Args:
+            item (DirectoryItem): The item to check.
+
+        Returns:
+            bool: True if the file on disk is larger than
+                DirectoryItem.MAX_INLINE_BYTES, False otherwise (including
+                when the path cannot be statted).
+        """
+        try:
+            return os.stat(item.path).st_size > DirectoryItem.MAX_INLINE_BYTES
+        except OSError:
+            return False
+
     def _is_empty_or_near_empty(self, content: Optional[str]) -> bool:
         """
         Check if the content is empty or near-empty.
@@ -257,21 +370,19 @@ class DirectorySummarizer:
         Returns:
             bool: True if the file should be summarized, False otherwise.
         """
-        if self.exclude_files and os.path.basename(file_path) in self.exclude_files:
+        file_name = os.path.basename(file_path)
+        if self.exclude_files and file_name in self.exclude_files:
             return False
         if self.exclude_dirs and os.path.dirname(file_path) in self.exclude_dirs:
             return False
         if self.exclude_extensions and os.path.splitext(file_path)[1] in self.exclude_extensions:
             return False
-        
+
         # Check file extension and name
-        _, ext = os.path.splitext(file_path)
-        file_name = os.path.basename(file_path)
-        if ext.lower() in self.allowed_extensions or file_name in self.allowed_files:
+        if file_path.lower().endswith(self._allowed_ext_suffixes) or file_name in self.allowed_files:
             # Even if extension is allowed, check if content is binary
-            print("checking:", file_name)
             return not (content and self.text_analyzer.is_binary_content(content))
-        
+
         return False
 
     def summarize_directory_structure_local(self, directory_structure: str, short_summary_length: int) -> dict:
@@ -325,44 +436,35 @@ class DirectorySummarizer:
         simple_json_structure = directory_structure.to_nested_dict(['type', 'short_summary'])
         tree_structure = TreeStyle.write_structure(directory_structure)
         
+        # All per-call variation (summary length, parent context, tree, JSON)
+        # goes after the static prefix so every call shares an identical head.
+        user_content = _DIRECTORY_USER_PROMPT_PREFIX
+        user_content += f"Write each short summary in {short_summary_length} characters or less.\n\n"
+        if parent_context:
+            user_content += f"Parent directory context: {_dumps_payload(parent_context)}\n\n"
+        user_content += (
+            f"Here is the directory structure:\n\n{tree_structure}\n\n"
+            f"Here is the formatted JSON:\n\n{_dumps_payload(simple_json_structure)}"
+        )
+
         messages = [
-            {
-                "role": "system",
-                "content": "You are a directory structure analyzer. Respond only with valid JSON."
-            }
+            _DIRECTORY_SYSTEM_MSG,
+            {"role": "user", "content": user_content}
         ]
-
-        # Add parent context if available
-        if parent_context:
-            messages.append({
-                "role": "system",
-                "content": f"Parent directory context: {json.dumps(parent_context)}"
-            })
-
-        messages.append({
-            "role": "user", 
-            "content": (
-                "Analyze the following directory structure:\n\n"
-                f"{tree_structure}\n\n"
-                "Use the following JSON object that matches the input structure to generate "
-                "`short_summary` fields overwriting the existing `short_summary` field. Use the existing `short_summary` value "
-                "for additional context about the existing file if it is not labled 'Empty File'. Generate a short summary for "
-                "each folder based on the files it contains and also store this in the field `short_summary`. "
-                f"Do not modify the structure in any other way. Write each short summary in {short_summary_length} characters "
-                f"or less. Here is the formatted JSON:\n\n{json.dumps(simple_json_structure, indent=2)}"
-            )
-        })
         logger.info("Sending request to API for summarization...")
         logger.info(f"Structure contains {len(directory_structure.items)} items "
                    f"({len(directory_structure.get_files())} files, "
                    f"{len(directory_structure.get_directories())} directories)")
 
-        stop_logging.clear()
-        logging_thread = threading.Thread(
-            target=log_periodically, 
-            args=("Waiting for response from OpenAI API...", 5)
-        )
-        logging_thread.start()
+        # Only pay for the heartbeat thread when its messages would be emitted
+        logging_thread = None
+        if logger.isEnabledFor(logging.INFO):
+            stop_logging.clear()
+            logging_thread = threading.Thread(
+                target=log_periodically,
+                args=("Waiting for response from OpenAI API...", 5)
+            )
+            logging_thread.start()
 
         try:
             response = self.client.chat.completions.create(
@@ -395,8 +497,9 @@ class DirectorySummarizer:
             return directory_structure
             
         finally:
-            stop_logging.set()
-            logging_thread.join()
+            if logging_thread is not None:
+                stop_logging.set()
+                logging_thread.join()
     
     def _merge_summaries(self, original: dict, new: dict) -> dict:
         """
@@ -411,7 +514,10 @@ class DirectorySummarizer:
         """
         for key, value in new.items():
             if key in original and isinstance(original[key], dict) and isinstance(value, dict):
-                original[key] = self._merge_summaries(original[key], value)
+                # Merge into a copy of the child: structures from JSONStyle
+                # share frozen placeholder dicts between nodes, so writing
+                # through the existing reference could update every alias.
+                original[key] = self._merge_summaries(dict(original[key]), value)
             else:
                 original[key] = value
         return original
@@ -461,7 +567,7 @@ class DirectorySummarizer:
             response = self.client.chat.completions.create(
                 model="gpt-4o-mini",
                 messages=[
-                    {"role": "system", "content": "You are an assistant that generates project summaries."},
+                    _PROJECT_SYSTEM_MSG,
                     {"role": "user", "content": prompt}
                 ],
                 max_tokens=150,
@@ -497,48 +603,75 @@ class FileSummarizer:
     """
     Class to summarize a file's content using the OpenAI API or a local model.
     """
-    def __init__(self, config: dict):
+    def __init__(self, config: dict, client: Optional[OpenAI] = None):
         """
         Initialize the FileSummarizer object.
 
         Args:
             config (dict): The config for the summarizer.
+            client (Optional[OpenAI]): An existing sync client to share. When
+                provided (e.g. by DirectorySummarizer), both summarizers reuse
+                a single connection pool instead of opening one each.
         """
         self.is_local = config.get("use_local", False)
         self.max_file_summary_words = config.get("max_file_summary_words", 50)
         self.max_short_summary_characters = config.get("max_short_summary_characters", 75)
-        self.client = None
+        self.client = client
+        self.aclient = None
         if not self.is_local:
             api_token = config.get("api_token")
             if not api_token:
                 raise ValueError("API token is not set. Please set the API token in the preferences.")
-            self.client = OpenAI(api_key=api_token)
+            if self.client is None:
+                self.client = OpenAI(api_key=api_token)
+            self.aclient = AsyncOpenAI(api_key=api_token, http_client=_build_async_http_client())
         self.max_workers = config.get("max_workers", 5)
         self.requests_per_minute = config.get("requests_per_minute", 50)
         self.batch_size = config.get("batch_size", 10)
+        self.batch_char_budget = config.get("batch_char_budget", 16000)
         self.cache = SummaryCache(
             cache_dir=config.get("cache_dir", ".summary_cache"),
             ttl_days=config.get("cache_ttl_days", 7)
         )
+        # In-process memo keyed by content cache key, deduplicating identical
+        # content within a single run ahead of the persistent cache.
+        self._memo: Dict[str, dict] = {}
         self.chunk_size = config.get("chunk_size", 4000)
+        self.chunk_token_budget = config.get(
+            "chunk_token_budget",
+            _MODEL_CONTEXT_TOKENS - _COMPLETION_TOKENS - _PROMPT_OVERHEAD_TOKENS
+        )
         self.concurrent_chunks = config.get("concurrent_chunks", 3)
 
-    @sleep_and_retry
-    @limits(calls=50, period=60)  # Rate limit: 50 calls per minute
-    def _rate_limited_api_call(self, messages: List[Dict], model: str, max_tokens: int, temperature: float) -> Any:
-        """Make a rate-limited API call to OpenAI."""
-        return self.client.chat.completions.create(
-            model=model,
-            messages=messages,
-            max_tokens=max_tokens,
-            temperature=temperature,
-            response_format={"type": "json_object"}
+        # Precompiled prompt prefixes: these depend only on the configured
+        # summary limits, so build them once instead of per request.
+        self._summary_prompt_prefix = (
+            f"Please provide a JSON response with both a long summary and a short summary of the following file content. "
+            "The long summary should be a brief description of the content, and the short summary should be a concise version of the long summary. "
+            "Explain the purpose of the content and any key points. "
+            f"The long summary should be limited to {self.max_file_summary_words} words and the short summary should be limited to {self.max_short_summary_characters} characters. "
+            "Short summaries should not have any new lines. Return the summaries in the following format:\n\n"
+            f"{{\n  \"summary\": \"This is the long summary.\",\n  \"short_summary\": \"This is the short summary.\"\n}}"
         )
-    
+        self._batch_prompt_prefix = (
+            "Please provide a JSON response summarizing each of the following files. "
+            "Each file is delimited by `<<<FILE path>>>` and `<<<END>>>` markers. "
+            "For every file return both a long summary and a short summary. "
+            "The long summary should be a brief description of the content, and the short summary should be a concise version of the long summary. "
+            f"The long summary should be limited to {self.max_file_summary_words} words and the short summary should be limited to {self.max_short_summary_characters} characters. "
+            "Short summaries should not have any new lines. Return the summaries keyed by file path in the following format:\n\n"
+            f"{{\n  \"summaries\": {{\n    \"path/to/file\": {{\"summary\": \"This is the long summary.\", \"short_summary\": \"This is the short summary.\"}}\n  }}\n}}"
+        )
+
     def clear_cache(self):
         """Clear the cache."""
         self.cache.clear()
 
+    async def aclose(self):
+        """Close the async client and its connection pool."""
+        if self.aclient is not None:
+            await self.aclient.close()
+
     def summarize_items_parallel(self, items: List[DirectoryItem], max_words: int = 100) -> Dict[str, Dict]:
         """
         Summarize multiple DirectoryItems in parallel.
@@ -564,54 +697,235 @@ class FileSummarizer:
         if not items_to_summarize:
             return {}
 
-        # Process items in batches to avoid overwhelming the API
-        results = {}
-        for i in range(0, len(items_to_summarize), self.batch_size):
-            batch = items_to_summarize[i:i + self.batch_size]
-            batch_results = self._process_batch(batch, max_words)
-            results.update(batch_results)
-            
-            # Small delay between batches to help with rate limiting
-            if i + self.batch_size < len(items_to_summarize):
-                time.sleep(1)
-
-        return results
+        # Fan out all item summaries concurrently on the event loop
+        return asyncio.run(self._summarize_items_async(items_to_summarize, max_words))
 
-    def _process_batch(self, items: List[DirectoryItem], max_words: int) -> Dict[str, Dict]:
+    async def _summarize_items_async(self, items: List[DirectoryItem], max_words: int) -> Dict[str, Dict]:
         """
-        Process a batch of items using a thread pool.
+        Summarize items concurrently via asyncio.gather, bounded by a semaphore.
+
+        Small files are fused into batched requests (one chat completion per
+        batch); large files keep the per-file chunked path.
 
         Args:
-            items (List[DirectoryItem]): Batch of items to process
+            items (List[DirectoryItem]): Items to summarize
             max_words (int): Maximum words per summary
 
         Returns:
             Dict[str, Dict]: Dictionary mapping file paths to their summaries
         """
-        results = {}
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            future_to_item = {
-                executor.submit(self._summarize_item, item, max_words): item
-                for item in items
-            }
+        results: Dict[str, Dict] = {}
+
+        # Preload file contents off the event loop so disk reads overlap
+        # instead of serializing ahead of the network calls. DirectoryItem
+        # caches the content, so later .content accesses are in-memory.
+        read_semaphore = asyncio.Semaphore((os.cpu_count() or 1) * 4)
+
+        async def preload(item: DirectoryItem) -> None:
+            async with read_semaphore:
+                await asyncio.to_thread(getattr, item, 'content')
+
+        await asyncio.gather(*(preload(item) for item in items), return_exceptions=True)
 
-            for future in as_completed(future_to_item):
-                item = future_to_item[future]
+        # Partition items: large files are chunked individually, everything
+        # else is batched into a handful of fused requests.
+        large_items: List[DirectoryItem] = []
+        small_items: List[DirectoryItem] = []
+        oversize_items: List[DirectoryItem] = []
+        for item in items:
+            if not item.content:
+                # content is None both for unreadable files and for files
+                # over MAX_INLINE_BYTES, which are deliberately never loaded
+                # inline; stream the over-cap ones from disk instead of
+                # dropping them with an empty summary.
                 try:
-                    summary_result = future.result()
-                    if summary_result:
-                        results[item.path] = summary_result
-                        # Update the item with new summaries
-                        item.summary = summary_result.get('summary', '')
-                        item.short_summary = summary_result.get('short_summary', '')
-                        item.metadata['content_hash'] = item.content_hash
-                except Exception as e:
-                    logger.error(f"Error processing {item.path}: {str(e)}")
+                    oversized = os.stat(item.path).st_size > DirectoryItem.MAX_INLINE_BYTES
+                except OSError:
+                    oversized = False
+                if oversized:
+                    oversize_items.append(item)
+                else:
                     results[item.path] = {"summary": "", "short_summary": ""}
+            elif len(item.content) > 5000:
+                large_items.append(item)
+            else:
+                small_items.append(item)
+
+        semaphore = asyncio.Semaphore(self.max_workers)
+
+        async def summarize_bounded(item: DirectoryItem) -> Dict[str, str]:
+            async with semaphore:
+                return await self._summarize_item_async(item, max_words)
+
+        async def summarize_streamed(item: DirectoryItem) -> Dict[str, str]:
+            async with semaphore:
+                return await self._summarize_large_file_async(item.path, item.name, max_words)
+
+        # One shared heartbeat task covers the whole fan-out; spawning a
+        # thread per request would mean hundreds of threads under load.
+        heartbeat = None
+        if logger.isEnabledFor(logging.INFO):
+            heartbeat = asyncio.create_task(
+                log_periodically_async("Waiting for responses from OpenAI API...", 5)
+            )
+
+        try:
+            summaries = await asyncio.gather(
+                *(summarize_bounded(item) for item in large_items),
+                *(summarize_streamed(item) for item in oversize_items),
+                return_exceptions=True
+            )
+            for item, summary_result in zip(large_items + oversize_items, summaries):
+                if isinstance(summary_result, Exception):
+                    logger.error(f"Error processing {item.path}: {str(summary_result)}")
+                    results[item.path] = {"summary": "", "short_summary": ""}
+                elif summary_result:
+                    results[item.path] = summary_result
+
+            if small_items:
+                results.update(await self._summarize_files_batch_async(small_items, max_words))
+        finally:
+            if heartbeat is not None:
+                heartbeat.cancel()
+
+        # Update the items with their new summaries
+        for item in items:
+            summary_result = results.get(item.path)
+            if summary_result and (summary_result.get('summary') or summary_result.get('short_summary')):
+                item.summary = summary_result.get('summary', '')
+                item.short_summary = summary_result.get('short_summary', '')
+                item.metadata['content_hash'] = item.content_hash
+
+        return results
+
+    async def _summarize_files_batch_async(self, items: List[DirectoryItem], max_words: int) -> Dict[str, Dict]:
+        """
+        Summarize a group of small files with fused batch requests.
+
+        Rather than one chat completion per file (N round trips, N prompt
+        prefixes), files are concatenated under delimited headers and the model
+        returns a single JSON dict of per-file summaries for each batch.
+
+        Args:
+            items (List[DirectoryItem]): Small files to summarize
+            max_words (int): Maximum words per summary
+
+        Returns:
+            Dict[str, Dict]: Dictionary mapping file paths to their summaries
+        """
+        results: Dict[str, Dict] = {}
+
+        # Serve cached content summaries first so they never consume batch budget
+        pending: List[DirectoryItem] = []
+        for item in items:
+            content_key = self.cache.get_content_key(item.content, "gpt-4o-mini", max_words)
+            cached = self._memo.get(content_key)
+            if cached is None:
+                cached = self.cache.get(content_key)
+                if cached is not None:
+                    self._memo[content_key] = cached
+            if cached is not None:
+                logger.info(f"🔵 Using cached summary for {item.name}")
+                results[item.path] = cached
+            else:
+                pending.append(item)
+
+        # Pack pending files into batches bounded by file count and character budget
+        batches: List[List[DirectoryItem]] = []
+        batch: List[DirectoryItem] = []
+        batch_chars = 0
+        for item in pending:
+            if batch and (len(batch) >= self.batch_size or batch_chars + len(item.content) > self.batch_char_budget):
+                batches.append(batch)
+                batch = []
+                batch_chars = 0
+            batch.append(item)
+            batch_chars += len(item.content)
+        if batch:
+            batches.append(batch)
+
+        semaphore = asyncio.Semaphore(self.max_workers)
+
+        async def summarize_batch(batch_items: List[DirectoryItem]) -> Dict[str, Dict]:
+            async with semaphore:
+                return await self._summarize_batch_api(batch_items, max_words)
+
+        batch_results = await asyncio.gather(
+            *(summarize_batch(b) for b in batches),
+            return_exceptions=True
+        )
+        for batch_result in batch_results:
+            if isinstance(batch_result, Exception):
+                logger.error(f"Error processing file batch: {str(batch_result)}")
+            else:
+                results.update(batch_result)
 
         return results
 
-    def _summarize_item(self, item: DirectoryItem, max_words: int) -> Dict[str, str]:
+    async def _summarize_batch_api(self, items: List[DirectoryItem], max_words: int) -> Dict[str, Dict]:
+        """
+        Summarize a batch of files in a single OpenAI request.
+
+        Args:
+            items (List[DirectoryItem]): The files in this batch
+            max_words (int): Maximum words per summary
+
+        Returns:
+            Dict[str, Dict]: Dictionary mapping file paths to their summaries
+        """
+        sections = "\n\n".join(
+            f"<<<FILE {item.path}>>>\n{item.content}\n<<<END>>>"
+            for item in items
+        )
+        messages = [
+            _FILE_SYSTEM_MSG,
+            {"role": "user", "content": (
+                f"{self._batch_prompt_prefix}"
+                f"\nDo not include any additional information in the response. Here are the files:\n\n{sections}"
+            )}
+        ]
+
+        logger.info(f"🔄 Processing batched summary request for {len(items)} files...")
+
+        try:
+            response = await self.aclient.chat.completions.create(
+                model="gpt-4o-mini",
+                messages=messages,
+                max_tokens=4096,
+                temperature=0.5,
+                response_format={"type": "json_object"}
+            )
+            if not response or not response.choices:
+                logger.error("Empty or invalid response from API")
+                return {item.path: {"summary": "", "short_summary": ""} for item in items}
+
+            try:
+                summaries = json.loads(response.choices[0].message.content).get("summaries", {})
+            except json.JSONDecodeError:
+                logger.error("Failed to parse JSON response from API")
+                return {item.path: {"summary": "", "short_summary": ""} for item in items}
+
+            results = {}
+            for item in items:
+                entry = summaries.get(item.path) or {}
+                result = {
+                    "summary": entry.get("summary", ""),
+                    "short_summary": entry.get("short_summary", "")
+                }
+                if result["summary"] or result["short_summary"]:
+                    content_key = self.cache.get_content_key(item.content, "gpt-4o-mini", max_words)
+                    self._memo[content_key] = result
+                    self.cache.set(content_key, result)
+                results[item.path] = result
+            return results
+        except AuthenticationError as e:
+            logger.error(f"Authentication error: {e}")
+            return {item.path: {"summary": "", "short_summary": ""} for item in items}
+        except Exception as e:
+            logger.error(f"❌ API Error for batched summary request: {str(e)}")
+            return {item.path: {"summary": "", "short_summary": ""} for item in items}
+
+    async def _summarize_item_async(self, item: DirectoryItem, max_words: int) -> Dict[str, str]:
         """
         Summarize a single DirectoryItem.
 
@@ -627,9 +941,9 @@ class FileSummarizer:
                 return {"summary": "", "short_summary": ""}
 
             if len(item.content) > 5000:
-                return self._summarize_large_content(item.name, item.content, max_words)
+                return await self._summarize_large_content_async(item.name, item.content, max_words)
             else:
-                return self._summarize_purpose_api(item.name, item.content, max_words)
+                return await self._summarize_purpose_api(item.name, item.content, max_words)
         except Exception as e:
             logger.error(f"Error summarizing {item.path}: {str(e)}")
             return {"summary": "", "short_summary": ""}
@@ -667,11 +981,11 @@ class FileSummarizer:
             max_content_length = 5000  # Adjust based on API limits
             if len(content) > max_content_length:
                 logger.info(f"File is large; summarizing in chunks. Summarizing {item.name or 'content'}...")
-                summary_dict = self._summarize_large_content(item.name, content, max_words)
+                summary_dict = asyncio.run(self._summarize_large_content_async(item.name, content, max_words))
                 summary = summary_dict.get('summary', '')
                 short_summary = summary_dict.get('short_summary', '')
             else:
-                summary_dict = self._summarize_purpose_api(item.name, content, max_words)
+                summary_dict = asyncio.run(self._summarize_purpose_api(item.name, content, max_words))
                 summary = summary_dict.get('summary', '')
                 short_summary = summary_dict.get('short_summary', '')
             
@@ -695,6 +1009,18 @@ class FileSummarizer:
             logger.error(f"File not found: {file_path}")
             return {"summary": "", "short_summary": ""}
 
+        if self.is_local:
+            logger.warning('Local summarization is not implemented yet.')
+            return {"summary": "Local summarization is not implemented yet.", "short_summary": ""}
+
+        file_name = os.path.basename(file_path)
+        max_content_length = 5000  # Adjust based on API limits
+        if os.path.getsize(file_path) > max_content_length:
+            # Large files are streamed chunk-by-chunk so peak memory stays
+            # around chunk_size rather than the full file size.
+            logger.info(f"File is large; summarizing in chunks. Summarizing {file_name}...")
+            return asyncio.run(self._summarize_large_file_async(file_path, file_name, max_words))
+
         try:
             with open(file_path, 'r', encoding='utf-8') as file:
                 content = file.read()
@@ -702,22 +1028,94 @@ class FileSummarizer:
             logger.error(f"Error reading file {file_path}: {e}")
             return {"summary": "", "short_summary": ""}
 
-        if self.is_local:
-            logger.warning('Local summarization is not implemented yet.')
-            return {"summary": "Local summarization is not implemented yet.", "short_summary": ""}
-        else:
-            file_name = os.path.basename(file_path)
-            # Check content size
-            max_content_length = 5000  # Adjust based on API limits
-            if len(content) > max_content_length:
-                logger.info(f"File is large; summarizing in chunks. Summarizing {file_name}...")
-                return self._summarize_large_content(content, max_words)
-            else:
-                return self._summarize_purpose_api(file_name, content, max_words)
+        return asyncio.run(self._summarize_purpose_api(file_name, content, max_words))
+
+    def _split_chunks(self, content: str) -> List[str]:
+        """
+        Split content into request-sized chunks.
+
+        When tiktoken is available, content is split on token boundaries into
+        windows that fill the model's input budget, cutting the number of API
+        round trips versus the conservative fixed character size. Without
+        tiktoken, the character-based chunking is kept as the fallback.
+        """
+        encoder = _get_token_encoder()
+        if encoder is None:
+            return [content[i:i + self.chunk_size] for i in range(0, len(content), self.chunk_size)]
+
+        tokens = encoder.encode(content)
+        budget = self.chunk_token_budget
+        return [encoder.decode(tokens[i:i + budget]) for i in range(0, len(tokens), budget)]
+
+    @staticmethod
+    def _iter_file_chunks(file_path: str, size: int):
+        """Yield successive decoded chunks of a file without loading it fully."""
+        with open(file_path, 'rb') as f:
+            while True:
+                block = f.read(size)
+                if not block:
+                    break
+                yield block.decode('utf-8', 'replace')
+
+    async def _summarize_large_file_async(self, file_path: str, file_name: str, max_words: int) -> dict:
+        """
+        Summarize a large file by streaming it in chunks from disk.
+
+        Chunks are read lazily in `concurrent_chunks`-sized windows and
+        summarized concurrently, so at most a window of chunks is resident in
+        memory at any time instead of the whole file plus its chunk list.
+
+        Args:
+            file_path (str): The path to the file to summarize.
+            file_name (str): The name of the file (used for cache keys and logs).
+            max_words (int): The maximum number of words for the summary.
+
+        Returns:
+            dict: The combined summary of all chunks and a short summary.
+        """
+        file_size = os.path.getsize(file_path)
+        total_chunks = max(1, -(-file_size // self.chunk_size))
+
+        chunk_iter = self._iter_file_chunks(file_path, self.chunk_size)
+        summaries: List[str] = []
+        chunk_idx = 0
+        try:
+            while True:
+                # Pull the next window of chunks off the event loop thread
+                window = []
+                while len(window) < self.concurrent_chunks:
+                    chunk = await asyncio.to_thread(next, chunk_iter, None)
+                    if chunk is None:
+                        break
+                    window.append((chunk_idx, chunk))
+                    chunk_idx += 1
+                if not window:
+                    break
+
+                window_results = await asyncio.gather(
+                    *(
+                        self._summarize_chunk_async(
+                            self.cache.get_chunk_key(file_name, idx, total_chunks),
+                            file_name, chunk, max_words, idx, total_chunks
+                        )
+                        for idx, chunk in window
+                    ),
+                    return_exceptions=True
+                )
+                for result in window_results:
+                    if isinstance(result, Exception):
+                        logger.error(f"Error processing chunk: {str(result)}")
+                    elif result and result.get('summary'):
+                        summaries.append(result['summary'])
+        except OSError as e:
+            logger.error(f"Error reading file {file_path}: {e}")
+            return {"summary": "", "short_summary": ""}
+
+        return await self._finalize_chunk_summaries(file_name, summaries, total_chunks, max_words)
 
-    def _summarize_large_content(self, file_name: str, content: str, max_words: int) -> dict:
+    async def _summarize_large_content_async(self, file_name: str, content: str, max_words: int) -> dict:
         """
-        Summarizes large content by splitting it into chunks.
+        Summarizes large content by splitting it into chunks and summarizing them concurrently.
 
         Args:
             file_name (str): The name of the file.
@@ -727,60 +1125,51 @@ class FileSummarizer:
         Returns:
             dict: The combined summary of all chunks and a short summary.
         """
-        chunks = [content[i:i + self.chunk_size] for i in range(0, len(content), self.chunk_size)]
+        chunks = self._split_chunks(content)
         total_chunks = len(chunks)
-        summaries = []
+        semaphore = asyncio.Semaphore(self.concurrent_chunks)
 
-        with ThreadPoolExecutor(max_workers=self.concurrent_chunks) as executor:
-            futures = []
-            for idx, chunk in enumerate(chunks):
-                chunk_key = self.cache.get_chunk_key(file_name, idx, total_chunks)
-                cached_result = self.cache.get(chunk_key)
-                
-                if cached_result:
-                    logger.info(f"🔵 Using cached chunk {idx + 1}/{total_chunks} for {file_name}")
-                    summaries.append(cached_result.get('summary', ''))
-                    continue
+        async def summarize_bounded(chunk_idx: int, chunk: str) -> Dict[str, str]:
+            chunk_key = self.cache.get_chunk_key(file_name, chunk_idx, total_chunks)
+            async with semaphore:
+                return await self._summarize_chunk_async(chunk_key, file_name, chunk, max_words, chunk_idx, total_chunks)
 
-                future = executor.submit(
-                    self._summarize_chunk,
-                    chunk_key,
-                    file_name,
-                    chunk,
-                    max_words,
-                    idx,
-                    total_chunks
-                )
-                futures.append(future)
+        chunk_results = await asyncio.gather(
+            *(summarize_bounded(idx, chunk) for idx, chunk in enumerate(chunks)),
+            return_exceptions=True
+        )
 
-            for future in as_completed(futures):
-                try:
-                    result = future.result()
-                    if result and result.get('summary'):
-                        summaries.append(result['summary'])
-                except Exception as e:
-                    logger.error(f"Error processing chunk: {str(e)}")
+        summaries = []
+        for result in chunk_results:
+            if isinstance(result, Exception):
+                logger.error(f"Error processing chunk: {str(result)}")
+            elif result and result.get('summary'):
+                summaries.append(result['summary'])
+
+        return await self._finalize_chunk_summaries(file_name, summaries, total_chunks, max_words)
 
-        # Combine and summarize
+    async def _finalize_chunk_summaries(self, file_name: str, summaries: List[str],
+                                        total_chunks: int, max_words: int) -> dict:
+        """Combine per-chunk summaries into the final cached summary."""
         if not summaries:
             return {"summary": "", "short_summary": ""}
 
         combined_summary = "\n".join(summaries)
         final_key = self.cache.get_chunk_key(file_name, -1, total_chunks)  # Special key for final summary
-        
+
         cached_final = self.cache.get(final_key)
         if cached_final:
             logger.info(f"🔵 Using cached final summary for {file_name}")
             return cached_final
 
         # Generate final summaries
-        final_result = self._summarize_purpose_api(file_name, combined_summary, max_words)
+        final_result = await self._summarize_purpose_api(file_name, combined_summary, max_words)
         if final_result:
             self.cache.set(final_key, final_result)
 
         return final_result
 
-    def _summarize_chunk(self, chunk_key: str, file_name: str, chunk: str, 
+    async def _summarize_chunk_async(self, chunk_key: str, file_name: str, chunk: str,
                         max_words: int, chunk_idx: int, total_chunks: int) -> Dict[str, str]:
         """Summarize a single chunk with caching."""
         try:
@@ -790,25 +1179,29 @@ class FileSummarizer:
                 return cached_result
 
             logger.info(f"🔄 Processing chunk {chunk_idx + 1}/{total_chunks} for {file_name}")
-            result = self._summarize_purpose_api(
+            result = await self._summarize_purpose_api(
                 f"{file_name}_chunk_{chunk_idx}",
                 chunk,
                 max_words
             )
-            
+
             if result and result.get('summary'):
                 self.cache.set(chunk_key, result)
-            
+
             return result
         except Exception as e:
             logger.error(f"Error processing chunk {chunk_idx + 1}/{total_chunks}: {str(e)}")
             return {"summary": "", "short_summary": ""}
 
-    @cached_api_call
-    def _summarize_purpose_api(self, file_name: str, content: str, max_length: int, is_short: bool=False) -> dict:
+    async def _summarize_purpose_api(self, file_name: str, content: str, max_length: int, is_short: bool=False) -> dict:
         """
         Summarizes the content using the OpenAI API.
 
+        Results are cached persistently keyed by a hash of the content itself,
+        so unchanged (or duplicated) file content never re-hits the API. An
+        in-process memo sits in front of the disk cache so duplicate content
+        within a run (generated files, copied licenses) costs a dict lookup.
+
         Args:
             file_name (str): The name of the file.
             content (str): The content to summarize.
@@ -822,16 +1215,23 @@ class FileSummarizer:
         temperature = 0.5
         model = "gpt-4o-mini"
 
-        # Prepare the prompt
+        cache_key = self.cache.get_content_key(content, model, max_length)
+        memoized = self._memo.get(cache_key)
+        if memoized is not None:
+            logger.debug(f"Memo hit for {file_name}")
+            return memoized
+
+        cached_result = self.cache.get(cache_key)
+        if cached_result is not None:
+            logger.info(f"🔵 Using cached summary for {file_name}")
+            self._memo[cache_key] = cached_result
+            return cached_result
+
+        # Prepare the prompt; only the file name and content vary per call
         messages = [
-            {"role": "system", "content": "You are a helpful assistant that summarizes file content into markdown format."},
+            _FILE_SYSTEM_MSG,
             {"role": "user", "content": (
-                f"Please provide a JSON response with both a long summary and a short summary of the following file content. "
-                "The long summary should be a brief description of the content, and the short summary should be a concise version of the long summary. "
-                "Explain the purpose of the content and any key points. "
-                f"The long summary should be limited to {self.max_file_summary_words} words and the short summary should be limited to {self.max_short_summary_characters} characters. "
-                "Short summaries should not have any new lines. Return the summaries in the following format:\n\n"
-                f"{{\n  \"summary\": \"This is the long summary.\",\n  \"short_summary\": \"This is the short summary.\"\n}}"
+                f"{self._summary_prompt_prefix}"
                 f"Do not include any additional information in the response. Here is the content for the file {file_name}:\n\n"
                 f"{content}"
             )}
@@ -839,12 +1239,8 @@ class FileSummarizer:
 
         logger.info(f"🔄 Processing summary request for {file_name}...")
 
-        stop_logging.clear()
-        logging_thread = threading.Thread(target=log_periodically, args=("Waiting for response from OpenAI API...", 5))
-        logging_thread.start()
-
         try:
-            response = self.client.chat.completions.create(
+            response = await self.aclient.chat.completions.create(
                 model=model,
                 messages=messages,
                 max_tokens=max_tokens,
@@ -859,10 +1255,14 @@ class FileSummarizer:
             summary_response = response.choices[0].message.content.strip()
             try:
                 summary_dict = json.loads(summary_response)
-                return {
+                result = {
                     "summary": summary_dict.get("summary", ""),
                     "short_summary": summary_dict.get("short_summary", "")
                 }
+                if result["summary"] or result["short_summary"]:
+                    self._memo[cache_key] = result
+                    self.cache.set(cache_key, result)
+                return result
             except json.JSONDecodeError:
                 logger.error("Failed to parse JSON response from API")
                 return {"summary": "", "short_summary": ""}
@@ -871,7 +1271,4 @@ class FileSummarizer:
             return {"summary": "", "short_summary": ""}
         except Exception as e:
             logger.error(f"❌ API Error for {file_name}: {str(e)}")
-            return {"summary": "", "short_summary": ""}
-        finally:
-            stop_logging.set()
-            logging_thread.join()
\ No newline at end of file
+            return {"summary": "", "short_summary": ""}
\ No newline at end of file
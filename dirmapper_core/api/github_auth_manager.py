@@ -0,0 +1,183 @@
+# dirmapper_core/api/github_auth_manager.py
+
+import time
+from typing import Any, Optional, Tuple, Union
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from dirmapper_core.utils.logger import logger
+
+GITHUB_API_URL = "https://api.github.com"
+
+class GitHubAuthManager:
+    """
+    Class to manage GitHub API authentication and the shared HTTP session.
+
+    A single persistent requests.Session is created per manager so that
+    HTTP keep-alive and connection pooling are reused across calls instead
+    of paying a fresh TCP + TLS handshake per request.
+
+    Attributes:
+        token (Optional[str]): The GitHub personal access token, if any.
+        session (requests.Session): The shared session used for all API calls.
+    """
+    def __init__(self, token: Optional[str] = None):
+        """
+        Initialize the GitHubAuthManager object.
+
+        Args:
+            token (Optional[str]): GitHub personal access token. Unauthenticated
+                requests are allowed but subject to much lower rate limits.
+        """
+        self.token = token
+        self.session = requests.Session()
+        # One adapter sized for concurrent use; mounted for the API host so
+        # pooled connections are reused across all requests.
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20)
+        self.session.mount(GITHUB_API_URL, adapter)
+        self.session.headers.update({
+            "Accept": "application/vnd.github+json",
+            "X-GitHub-Api-Version": "2022-11-28",
+        })
+        if token:
+            self.session.headers["Authorization"] = f"Bearer {token}"
+        # ETag response cache: url -> (etag, parsed body). Conditional requests
+        # that come back 304 are free against the primary rate limit and skip
+        # the response body entirely.
+        self._etag_cache: dict = {}
+        # Local rate-limit budget tracked from X-RateLimit-* response headers,
+        # used to throttle before a request rather than retrying after a 403.
+        self._remaining: Optional[int] = None
+        self._reset_epoch: float = 0.0
+        self._rate_limit_threshold = 1
+
+    def _throttle(self) -> None:
+        """Sleep until the rate-limit window resets when the budget is spent."""
+        if self._remaining is not None and self._remaining <= self._rate_limit_threshold:
+            delay = self._reset_epoch - time.time()
+            if delay > 0:
+                logger.warning(f"GitHub rate limit nearly exhausted; sleeping {delay:.0f}s until reset")
+                time.sleep(delay)
+            self._remaining = None
+
+    def _update_rate_limit(self, response: requests.Response) -> None:
+        """Record the remaining budget and reset time from a response."""
+        remaining = response.headers.get('X-RateLimit-Remaining')
+        reset = response.headers.get('X-RateLimit-Reset')
+        if remaining is not None:
+            try:
+                self._remaining = int(remaining)
+            except ValueError:
+                pass
+        if reset is not None:
+            try:
+                self._reset_epoch = float(reset)
+            except ValueError:
+                pass
+
+    def cached_get(self, url: str) -> Union[dict, list]:
+        """
+        GET a URL through the session with ETag-conditional caching.
+
+        When a previous response for the URL carried an ETag, the request is
+        sent with If-None-Match; a 304 answer returns the cached body without
+        consuming rate-limit quota or transferring a payload.
+
+        Args:
+            url (str): The URL to request.
+
+        Returns:
+            Union[dict, list]: The parsed JSON body.
+
+        Raises:
+            requests.HTTPError: If the request fails.
+        """
+        headers = {}
+        cached: Optional[Tuple[str, Any]] = self._etag_cache.get(url)
+        if cached:
+            headers['If-None-Match'] = cached[0]
+
+        for _ in range(2):
+            self._throttle()
+            response = self.session.get(url, headers=headers)
+            self._update_rate_limit(response)
+            # Honor Retry-After on secondary limits directly; a computed
+            # retry schedule would just re-hit the same window.
+            retry_after = response.headers.get('Retry-After')
+            if response.status_code in (403, 429) and retry_after:
+                try:
+                    time.sleep(min(float(retry_after), 60.0))
+                except ValueError:
+                    pass
+                continue
+            break
+
+        if response.status_code == 304 and cached:
+            logger.debug(f"ETag cache hit for {url}")
+            return cached[1]
+        response.raise_for_status()
+
+        body = response.json()
+        etag = response.headers.get('ETag')
+        if etag:
+            self._etag_cache[url] = (etag, body)
+        return body
+
+    def validate_token(self) -> bool:
+        """
+        Validate the configured token against the GitHub API.
+
+        Returns:
+            bool: True if the token is valid, False otherwise.
+        """
+        if not self.token:
+            return False
+        try:
+            response = self.session.get(f"{GITHUB_API_URL}/user")
+            return response.status_code == 200
+        except requests.RequestException as e:
+            logger.error(f"Error validating GitHub token: {e}")
+            return False
+
+    def get_user_details(self) -> dict:
+        """
+        Get the details of the authenticated user.
+
+        Returns:
+            dict: The user details, or an empty dict on failure.
+        """
+        try:
+            response = self.session.get(f"{GITHUB_API_URL}/user")
+            response.raise_for_status()
+            return response.json()
+        except requests.RequestException as e:
+            logger.error(f"Error fetching GitHub user details: {e}")
+            return {}
+
+    def get_repository_details(self, owner: str, repo: str) -> dict:
+        """
+        Get the details of a repository.
+
+        Args:
+            owner (str): The repository owner.
+            repo (str): The repository name.
+
+        Returns:
+            dict: The repository details, or an empty dict on failure.
+        """
+        try:
+            return self.cached_get(f"{GITHUB_API_URL}/repos/{owner}/{repo}")
+        except requests.RequestException as e:
+            logger.error(f"Error fetching repository details for {owner}/{repo}: {e}")
+            return {}
+
+    def close(self) -> None:
+        """Close the session and shut down its connection pool."""
+        self.session.close()
+
+    def __enter__(self) -> "GitHubAuthManager":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
@@ -0,0 +1,339 @@
+# dirmapper_core/api/github_repository_manager.py
+
+import asyncio
+import base64
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict
+from typing import List, Optional, Union, TYPE_CHECKING
+
+import httpx
+import requests
+
+from dirmapper_core.api.github_auth_manager import GITHUB_API_URL, GitHubAuthManager
+from dirmapper_core.utils.logger import logger
+
+# Only runs for type checking and avoids circular imports in runtime; does not affect runtime
+if TYPE_CHECKING:
+    from dirmapper_core.models.directory_item import DirectoryItem
+
+class GitHubRepositoryManager:
+    """
+    Class to fetch repository contents from the GitHub API.
+
+    All requests are routed through the GitHubAuthManager's persistent
+    session so authentication headers and pooled connections are shared.
+
+    Attributes:
+        auth_manager (GitHubAuthManager): The auth manager providing the session.
+    """
+    def __init__(self, auth_manager: GitHubAuthManager):
+        """
+        Initialize the GitHubRepositoryManager object.
+
+        Args:
+            auth_manager (GitHubAuthManager): The auth manager whose session
+                is used for all API calls.
+        """
+        self.auth_manager = auth_manager
+        self._aclient: Optional[httpx.AsyncClient] = None
+
+    @property
+    def session(self) -> requests.Session:
+        """The shared HTTP session from the auth manager."""
+        return self.auth_manager.session
+
+    def _get_async_client(self) -> httpx.AsyncClient:
+        """
+        Lazily build the shared async client used for concurrent fetches.
+
+        The client mirrors the session's headers (auth, Accept) and is reused
+        across calls so pooled connections stay warm.
+        """
+        if self._aclient is None or self._aclient.is_closed:
+            self._aclient = httpx.AsyncClient(
+                headers=dict(self.session.headers),
+                limits=httpx.Limits(max_connections=20),
+                timeout=httpx.Timeout(30.0, connect=10.0)
+            )
+        return self._aclient
+
+    async def aclose(self) -> None:
+        """Close the async client and its connection pool."""
+        if self._aclient is not None and not self._aclient.is_closed:
+            await self._aclient.aclose()
+
+    async def aget_repository_contents(self, owner: str, repo: str, path: str = "") -> Union[List[dict], dict]:
+        """
+        Async counterpart of get_repository_contents.
+
+        Args:
+            owner (str): The repository owner.
+            repo (str): The repository name.
+            path (str): The path within the repository ('' for the root).
+
+        Returns:
+            Union[List[dict], dict]: A list of entries for a directory, a dict
+                for a single file, or an empty list on failure.
+        """
+        url = f"{GITHUB_API_URL}/repos/{owner}/{repo}/contents/{path}"
+        try:
+            response = await self._get_async_client().get(url)
+            response.raise_for_status()
+            return response.json()
+        except httpx.HTTPError as e:
+            logger.error(f"Error fetching contents of {owner}/{repo}/{path}: {e}")
+            return []
+
+    async def aget_file_content(self, owner: str, repo: str, path: str) -> Optional[str]:
+        """
+        Async counterpart of get_file_content.
+
+        Args:
+            owner (str): The repository owner.
+            repo (str): The repository name.
+            path (str): The path to the file within the repository.
+
+        Returns:
+            Optional[str]: The decoded file content, or None on failure.
+        """
+        payload = await self.aget_repository_contents(owner, repo, path)
+        if not isinstance(payload, dict):
+            return None
+        content = payload.get('content')
+        if content is None:
+            return None
+        try:
+            return base64.b64decode(content).decode('utf-8', 'replace')
+        except (ValueError, TypeError) as e:
+            logger.error(f"Error decoding content for {owner}/{repo}/{path}: {e}")
+            return None
+
+    async def walk_tree(self, owner: str, repo: str, path: str = "") -> List[dict]:
+        """
+        Walk a repository tree breadth-first, fetching each level's
+        directories concurrently.
+
+        Instead of one blocking round trip per directory, every directory at
+        the current depth is fetched in a single asyncio.gather, collapsing N
+        sequential round trips per level into roughly one.
+
+        Args:
+            owner (str): The repository owner.
+            repo (str): The repository name.
+            path (str): The path to start from ('' for the repository root).
+
+        Returns:
+            List[dict]: All content entries discovered, as returned by the API.
+        """
+        entries: List[dict] = []
+        level = [path]
+        while level:
+            level_results = await asyncio.gather(
+                *(self.aget_repository_contents(owner, repo, sub) for sub in level),
+                return_exceptions=True
+            )
+            next_level: List[str] = []
+            for sub_path, result in zip(level, level_results):
+                if isinstance(result, Exception):
+                    logger.error(f"Error walking {owner}/{repo}/{sub_path}: {result}")
+                    continue
+                listing = result if isinstance(result, list) else [result]
+                for entry in listing:
+                    entries.append(entry)
+                    if entry.get('type') == 'dir':
+                        next_level.append(entry.get('path', ''))
+            level = next_level
+        return entries
+
+    def walk_tree_sync(self, owner: str, repo: str, path: str = "") -> List[dict]:
+        """Synchronous wrapper around walk_tree for blocking callers."""
+        return asyncio.run(self.walk_tree(owner, repo, path))
+
+    def crawl(self, owner: str, repo: str, paths: List[str], max_workers: int = 8) -> Dict[str, Union[List[dict], dict]]:
+        """
+        Fetch the contents of several repository paths concurrently with threads.
+
+        Threads share the persistent session's connection pool, overlapping
+        network round trips without requiring async callers. The worker count
+        is additionally capped by the current rate-limit budget so a wide
+        crawl cannot burn through the remaining quota in one burst.
+
+        Args:
+            owner (str): The repository owner.
+            repo (str): The repository name.
+            paths (List[str]): The repository paths to fetch.
+            max_workers (int): Upper bound on concurrent requests.
+
+        Returns:
+            Dict[str, Union[List[dict], dict]]: Mapping of path to its contents.
+        """
+        if not paths:
+            return {}
+        remaining = self.auth_manager._remaining
+        if remaining is not None:
+            max_workers = min(max_workers, max(1, remaining // 10))
+        max_workers = max(1, min(max_workers, len(paths)))
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = executor.map(lambda p: self.get_repository_contents(owner, repo, p), paths)
+            return dict(zip(paths, results))
+
+    def get_full_tree(self, owner: str, repo: str, ref: str = 'HEAD') -> List["DirectoryItem"]:
+        """
+        Enumerate an entire repository with a single Git Trees API call.
+
+        `GET /git/trees/{ref}?recursive=1` returns every blob and tree in one
+        response, replacing the O(directories) per-folder /contents crawl —
+        hundreds of requests (and rate-limit tokens) become one or two. When
+        GitHub truncates the recursive listing, the per-directory walk is used
+        as the fallback.
+
+        Args:
+            owner (str): The repository owner.
+            repo (str): The repository name.
+            ref (str): The ref to enumerate (default 'HEAD' for the default branch).
+
+        Returns:
+            List[DirectoryItem]: One item per tree entry, with 'type'
+                ('file' or 'directory') and 'size' carried in metadata.
+        """
+        url = f"{GITHUB_API_URL}/repos/{owner}/{repo}/git/trees/{ref}?recursive=1"
+        payload = self.make_request_with_retry(url)
+        if not isinstance(payload, dict):
+            return []
+
+        if payload.get('truncated'):
+            logger.warning(f"Tree listing for {owner}/{repo} was truncated; falling back to per-directory crawl")
+            entries = self.walk_tree_sync(owner, repo)
+            return [self._entry_to_item(entry) for entry in entries]
+
+        return [self._tree_entry_to_item(entry) for entry in payload.get('tree', [])]
+
+    @staticmethod
+    def _tree_entry_to_item(entry: dict) -> "DirectoryItem":
+        """Map a Git Trees API entry onto a DirectoryItem."""
+        from dirmapper_core.models.directory_item import DirectoryItem
+
+        path = entry.get('path', '')
+        metadata = {
+            'type': 'directory' if entry.get('type') == 'tree' else 'file',
+            'size': entry.get('size'),
+            'sha': entry.get('sha'),
+        }
+        return DirectoryItem(path, path.count('/'), path.rsplit('/', 1)[-1], metadata)
+
+    @staticmethod
+    def _entry_to_item(entry: dict) -> "DirectoryItem":
+        """Map a /contents API entry onto a DirectoryItem."""
+        from dirmapper_core.models.directory_item import DirectoryItem
+
+        path = entry.get('path', '')
+        metadata = {
+            'type': 'directory' if entry.get('type') == 'dir' else 'file',
+            'size': entry.get('size'),
+            'sha': entry.get('sha'),
+        }
+        return DirectoryItem(path, path.count('/'), entry.get('name', path.rsplit('/', 1)[-1]), metadata)
+
+    def make_request_with_retry(self, url: str, max_retries: int = 3) -> Optional[Union[dict, list]]:
+        """
+        GET a URL through the shared session, retrying on failure.
+
+        Requests go through the auth manager's ETag cache, so repeat fetches
+        of unchanged resources answer from cache via a 304 without consuming
+        rate-limit quota.
+
+        Transient failures (5xx, connection errors, timeouts) are retried with
+        exponential backoff plus jitter so concurrent clients spread their
+        retries out instead of re-hitting the API in lockstep; other 4xx
+        responses fail fast. Retry-After on 403/429 is already honored inside
+        cached_get before the error surfaces here.
+
+        Args:
+            url (str): The URL to request.
+            max_retries (int): Maximum number of attempts.
+
+        Returns:
+            Optional[Union[dict, list]]: The parsed JSON body, or None if all
+                attempts failed.
+        """
+        error: Optional[Exception] = None
+        for attempt in range(max_retries):
+            try:
+                return self.auth_manager.cached_get(url)
+            except requests.HTTPError as e:
+                status = e.response.status_code if e.response is not None else None
+                if status is not None and 400 <= status < 500 and status != 429:
+                    logger.error(f"Request to {url} failed with HTTP {status}; not retrying")
+                    return None
+                error = e
+            except (requests.ConnectionError, requests.Timeout) as e:
+                error = e
+            except requests.RequestException as e:
+                logger.error(f"Request to {url} failed: {e}")
+                return None
+
+            if attempt < max_retries - 1:
+                delay = min(2 ** attempt * (1 + random.uniform(0, 0.5)), 30.0)
+                logger.warning(f"Request to {url} failed ({error}); retrying in {delay:.1f}s")
+                time.sleep(delay)
+
+        logger.error(f"Request to {url} failed after {max_retries} attempts: {error}")
+        return None
+
+    def get_repository_contents(self, owner: str, repo: str, path: str = "") -> Union[List[dict], dict]:
+        """
+        Get the contents of a repository path.
+
+        Args:
+            owner (str): The repository owner.
+            repo (str): The repository name.
+            path (str): The path within the repository ('' for the root).
+
+        Returns:
+            Union[List[dict], dict]: A list of entries for a directory, a dict
+                for a single file, or an empty list on failure.
+        """
+        url = f"{GITHUB_API_URL}/repos/{owner}/{repo}/contents/{path}"
+        payload = self.make_request_with_retry(url)
+        if payload is None:
+            return []
+        return payload
+
+    def get_file_content(self, owner: str, repo: str, path: str, stream_to=None) -> Optional[str]:
+        """
+        Get the content of a file in a repository.
+
+        The request uses the raw media type, so GitHub returns the file bytes
+        directly instead of a JSON envelope with base64 content — skipping a
+        decode and a full in-memory copy of the payload.
+
+        Args:
+            owner (str): The repository owner.
+            repo (str): The repository name.
+            path (str): The path to the file within the repository.
+            stream_to: Optional binary file-like object. When given, the
+                response is streamed into it in 64 KiB chunks and None is
+                returned, keeping peak memory flat for huge files.
+
+        Returns:
+            Optional[str]: The file content, None when streaming, or None on failure.
+        """
+        url = f"{GITHUB_API_URL}/repos/{owner}/{repo}/contents/{path}"
+        try:
+            response = self.session.get(
+                url,
+                headers={'Accept': 'application/vnd.github.raw+json'},
+                stream=stream_to is not None
+            )
+            response.raise_for_status()
+            if stream_to is not None:
+                for chunk in response.iter_content(chunk_size=65536):
+                    stream_to.write(chunk)
+                return None
+            return response.text
+        except requests.RequestException as e:
+            logger.error(f"Error fetching content for {owner}/{repo}/{path}: {e}")
+            return None
@@ -2,6 +2,11 @@ import json
 from dirmapper_core.models.directory_structure import DirectoryStructure
 from dirmapper_core.formatter.base_formatter import BaseFormatter
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 class PlainTextFormatter(BaseFormatter):
     """
     Formats directory structure as plain text using the provided style.
@@ -35,7 +40,12 @@ class JSONFormatter(BaseFormatter):
             raise ValueError("Style must be provided in instructions")
             
         style = instructions.get('style')
-        return json.dumps(style.write_structure(data, **(instructions or {})), indent=4)
+        structure = style.write_structure(data, **(instructions or {}))
+        # orjson serializes at C speed; fall back to stdlib json when it is
+        # not installed. Indent width differs (2 vs 4), content is identical.
+        if orjson is not None:
+            return orjson.dumps(structure, option=orjson.OPT_INDENT_2).decode()
+        return json.dumps(structure, indent=4)
 
 class MarkdownFormatter(BaseFormatter):
     """
@@ -93,38 +93,79 @@ class DirectoryStructureGenerator:
             log_exception(os.path.basename(__file__), e)
             sys.exit(1)
 
+    def _sorted_dir_entries(self, path: str) -> List[os.DirEntry]:
+        """
+        Scan a directory and return its DirEntry objects in sorted order.
+
+        Args:
+            path (str): The directory to scan.
+
+        Returns:
+            List[os.DirEntry]: The entries, ordered by the sorting strategy.
+        """
+        # os.scandir yields DirEntry objects whose is_file/is_dir results are
+        # cached from the directory read, so no per-entry stat calls are needed
+        with os.scandir(path) as entries_iter:
+            dir_entries = {entry.name: entry for entry in entries_iter}
+        return [dir_entries[name] for name in self.sorting_strategy.sort(list(dir_entries))]
+
     def _build_sorted_structure(self, current_dir: str, level: int) -> DirectoryStructure:
         """
         Build the sorted directory structure.
-        
+
+        The walk is depth-first but iterative: a stack of live entry iterators
+        replaces recursion (a Python frame plus an intermediate
+        DirectoryStructure per directory, and a RecursionError risk on very
+        deep trees), with every item appended to one structure.
+
         Args:
             current_dir (str): The current directory to build the structure from.
             level (int): The current level of depth in the directory structure.
-        
+
         Returns:
             DirectoryStructure: The sorted directory structure.
         """
         structure = DirectoryStructure()
-        dir_contents = os.listdir(current_dir)
-        sorted_contents = self.sorting_strategy.sort(dir_contents)
-        
         if level > self.max_depth:
-            relative_path = os.path.relpath(current_dir, self.root_dir)
             structure.add_item(DirectoryItem(os.path.join(current_dir, ". . ."), level, ". . ."))
             return structure
-        
-        for item in sorted_contents:
-            item_path = os.path.join(current_dir, item)
-            if self.ignorer.should_ignore(item_path):
-                continue
-            metadata = {}
-            if os.path.isfile(item_path):
-                metadata['content'] = None  # Indicate that content is available but not loaded
-            structure.add_item(DirectoryItem(item_path, level, item, metadata))
-
-            if os.path.isdir(item_path):
-                sub_structure = self._build_sorted_structure(item_path, level + 1)
-                structure.items.extend(sub_structure.to_list())
+
+        add_item = structure.add_item
+        should_ignore = self.ignorer.should_ignore
+        max_depth = self.max_depth
+        stack = [(iter(self._sorted_dir_entries(current_dir)), level)]
+        while stack:
+            iterator, current_level = stack[-1]
+            for entry in iterator:
+                item_path = entry.path
+                if should_ignore(item_path):
+                    continue
+                is_file = entry.is_file()
+                # Carry the type from the walk so DirectoryItem does not re-stat
+                metadata = {'type': 'file' if is_file else 'directory'}
+                if is_file:
+                    metadata['content'] = None  # Indicate that content is available but not loaded
+                # The DirEntry caches its stat result from the walk; hand it to
+                # the item so metadata-hungry styles need no syscalls of their own.
+                try:
+                    stat_result = entry.stat()
+                except OSError:
+                    stat_result = None
+                add_item(DirectoryItem(item_path, current_level, entry.name, metadata,
+                                       stat_result=stat_result))
+
+                if entry.is_dir():
+                    next_level = current_level + 1
+                    if next_level > max_depth:
+                        add_item(DirectoryItem(os.path.join(item_path, ". . ."),
+                                               next_level, ". . ."))
+                        continue
+                    # Descend; this frame's iterator resumes once the
+                    # subdirectory is exhausted.
+                    stack.append((iter(self._sorted_dir_entries(item_path)), next_level))
+                    break
+            else:
+                stack.pop()
 
         return structure
 
@@ -10,20 +10,51 @@ class DirectoryItem:
     """
     Class to represent a directory item in a directory structure.
     """
-    def __init__(self, path: str, level: int, name: str, metadata: Optional[Dict] = None):
+    # Files larger than this are not loaded inline by the content property;
+    # use iter_content to process them without materializing the whole file.
+    MAX_INLINE_BYTES = 1024 * 1024
+
+    # Shared metadata defaults; copied/merged once in __init__ instead of
+    # building a dict and then re-checking every key per item.
+    _DEFAULT_META = {'type': None, 'content': None, 'summary': None, 'short_summary': None}
+
+    # Large trees allocate one of these per entry; __slots__ drops the
+    # per-instance __dict__ and speeds attribute access in the hot loops.
+    __slots__ = ('path', 'level', 'name', 'parts', 'metadata', 'stat_result', '_content')
+
+    def __init__(self, path: str, level: int, name: str, metadata: Optional[Dict] = None,
+                 stat_result: Optional[os.stat_result] = None):
         self.path = path
         self.level = level
         self.name = name
-        self.metadata = metadata or {'type': None, 'content': None, 'summary': None, 'short_summary': None, 'tags': []}
-
-        self._init_empty_metadata()
+        # Stat result captured during the directory walk, if any. Kept off
+        # metadata so it never leaks into serialized output; consumers like
+        # JSONStyle use it to skip re-statting the path.
+        self.stat_result = stat_result
+        # Split once at construction; consumers like to_nested_dict walk the
+        # components repeatedly and should not re-split the path each time.
+        self.parts = tuple(part for part in path.split(os.sep) if part)
+        if metadata is None:
+            merged = dict(self._DEFAULT_META)
+        else:
+            merged = {**self._DEFAULT_META, **metadata}
+        if not merged.get('type'):
+            merged['type'] = 'file' if os.path.isfile(path) else 'directory'
+        if not merged.get('tags'):
+            merged['tags'] = []
+        self.metadata = merged
 
         self._content = None  # Private attribute to store the content
 
     @property
     def type(self) -> str:
         """Get the type of the directory item."""
-        return self.metadata.get('type', 'file' if os.path.isfile(self.path) else 'directory')
+        # Only stat when the walker did not record a type: passing the
+        # fallback to .get() would evaluate os.path.isfile on every access.
+        item_type = self.metadata.get('type')
+        if item_type is not None:
+            return item_type
+        return 'file' if os.path.isfile(self.path) else 'directory'
     
     @type.setter
     def type(self, value: str) -> None:
@@ -87,7 +118,12 @@ class DirectoryItem:
         # Lazy load content from file if not already loaded and content is not hardcoded
         if self._content is None and 'content' in self.metadata:
             try:
-                with open(self.path, 'r') as f:
+                # Cap inline reads so one huge file cannot blow up memory;
+                # callers that need large files should use iter_content.
+                if os.stat(self.path).st_size > self.MAX_INLINE_BYTES:
+                    logger.debug(f"Skipping inline read of {self.path}: exceeds {self.MAX_INLINE_BYTES} bytes")
+                    return None
+                with open(self.path, 'r', encoding='utf-8', errors='replace') as f:
                     self._content = f.read()
                     self.content_hash = self._hash_content(self._content)  # Update hash
             except Exception as e:
@@ -95,6 +131,24 @@ class DirectoryItem:
                 logger.error(f"Failed to read content from {self.path}: {e}")
         return self._content
 
+    def iter_content(self, chunk_size: int = 65536):
+        """
+        Yield the file's content in chunks without loading it all into memory.
+
+        Args:
+            chunk_size (int): Number of characters to read per chunk.
+        """
+        try:
+            with open(self.path, 'r', encoding='utf-8', errors='replace',
+                      buffering=max(65536, chunk_size)) as f:
+                while True:
+                    chunk = f.read(chunk_size)
+                    if not chunk:
+                        break
+                    yield chunk
+        except Exception as e:
+            logger.error(f"Failed to read content from {self.path}: {e}")
+
     def _hash_content(self, content: str) -> str:
         """Compute a hash of the content."""
         return hashlib.md5(content.encode('utf-8')).hexdigest()
@@ -105,21 +159,6 @@ class DirectoryItem:
     def __str__(self):
         return "{}, {}, {}, {}".format(self.path, self.level, self.name, self.metadata)
     
-    def _init_empty_metadata(self):
-        """
-        Initialize empty metadata fields if they are None.
-        """
-        if not self.metadata.get('type'):
-            self.metadata['type'] = 'file' if os.path.isfile(self.path) else 'directory'
-        if not self.metadata.get('summary'):
-            self.metadata['summary'] = None
-        if not self.metadata.get('content'):
-            self.metadata['content'] = None
-        if not self.metadata.get('short_summary'):
-            self.metadata['short_summary'] = None
-        if not self.metadata.get('tags'):
-            self.metadata['tags'] = []
-                          
     def print(self) -> str:
         """
         Print the directory item to the console.
@@ -1,6 +1,7 @@
 # dirmapper_core/models/directory_structure.py
 
-from collections import defaultdict
+from bisect import bisect_left
+from collections import defaultdict, deque
 import os
 from typing import List, Dict, Optional, Union
 from dirmapper_core.ignore.ignore_list_reader import IgnorePattern
@@ -9,14 +10,68 @@ from dirmapper_core.utils.logger import logger
 import hashlib
 import json
 
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is the fallback
+    orjson = None
+
+def _dumps_sorted(obj) -> bytes:
+    """
+    Serialize hash input deterministically (sorted keys), via orjson's C
+    encoder when it is installed. Hashing re-serializes every item, so this
+    is the hottest JSON path in the model layer.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS)
+    return json.dumps(obj, sort_keys=True).encode()
+
 class DirectoryStructure:
     """
     Class to represent a directory structure.
     """
+    # The structure itself is the compact in-memory representation of the
+    # tree; nested dicts are only materialized at the API/template boundary.
+    # __slots__ keeps instances free of a per-object attribute dict.
+    __slots__ = ('description', 'items', '_content_hash', '_by_path', '_by_name',
+                 '_by_level', '_sorted_paths', '_sorted_items', '_indexed_count',
+                 '_levels', '_levels_count', '_dir_flags', '_dir_flags_count')
+
     def __init__(self):
         self.description = None
         self.items: List[DirectoryItem] = []
         self._content_hash: Optional[str] = None
+        # Lookup indices, rebuilt lazily whenever self.items has grown. They
+        # cannot be maintained purely in add_item because callers also extend
+        # self.items directly.
+        self._by_path: Dict[str, DirectoryItem] = {}
+        self._by_name: Dict[str, DirectoryItem] = {}
+        self._by_level: Dict[int, List[DirectoryItem]] = {}
+        self._sorted_paths: List[str] = []
+        self._sorted_items: List[DirectoryItem] = []
+        self._indexed_count = 0
+        self._levels: List[int] = []
+        self._levels_count = 0
+        self._dir_flags: List[bool] = []
+        self._dir_flags_count = 0
+
+    def _ensure_index(self) -> None:
+        """Rebuild the path/name/level indices if the item list has changed."""
+        if self._indexed_count == len(self.items):
+            return
+        by_path: Dict[str, DirectoryItem] = {}
+        by_name: Dict[str, DirectoryItem] = {}
+        by_level: Dict[int, List[DirectoryItem]] = defaultdict(list)
+        for item in self.items:
+            by_path.setdefault(item.path, item)
+            by_name.setdefault(item.path.rstrip('/').split('/')[-1], item)
+            by_level[item.level].append(item)
+        self._by_path = by_path
+        self._by_name = by_name
+        self._by_level = dict(by_level)
+        items_sorted = sorted(self.items, key=lambda i: i.path)
+        self._sorted_paths = [item.path for item in items_sorted]
+        self._sorted_items = items_sorted
+        self._indexed_count = len(self.items)
 
     @property
     def content_hash(self) -> str:
@@ -25,13 +80,13 @@ class DirectoryStructure:
             # Sort items by path for consistent hashing
             sorted_items = sorted(self.items, key=lambda x: x.path)
             # Include metadata in hash calculation
-            content = json.dumps([{
+            content = _dumps_sorted([{
                 'path': item.path,
                 'level': item.level,
                 'content_hash': item.content_hash,
                 'metadata': item.metadata
-            } for item in sorted_items], sort_keys=True)
-            self._content_hash = hashlib.sha256(content.encode()).hexdigest()
+            } for item in sorted_items])
+            self._content_hash = hashlib.sha256(content).hexdigest()
         return self._content_hash
 
     def add_item(self, item: DirectoryItem):
@@ -43,16 +98,50 @@ class DirectoryStructure:
         """Calculate a hash for a specific level in the directory structure."""
         level_items = [item for item in self.items if item.level == level]
         sorted_items = sorted(level_items, key=lambda x: x.path)
-        content = json.dumps([{
+        content = _dumps_sorted([{
             'path': item.path,
             'content_hash': item.content_hash,
             'metadata': item.metadata
-        } for item in sorted_items], sort_keys=True)
-        return hashlib.sha256(content.encode()).hexdigest()
+        } for item in sorted_items])
+        return hashlib.sha256(content).hexdigest()
 
     def to_list(self) -> List[DirectoryItem]:
         return self.items
 
+    @property
+    def levels(self) -> List[int]:
+        """
+        The per-item levels as a flat list (a column view of the structure).
+
+        The style renderers repeatedly compare neighbouring levels; indexing
+        this cached list avoids one attribute access per comparison and the
+        per-call list rebuild. Rebuilt lazily when the item list has grown,
+        like the path/name indices.
+        """
+        if self._levels_count != len(self.items):
+            self._levels = [item.level for item in self.items]
+            self._levels_count = len(self.items)
+        return self._levels
+
+    @property
+    def dir_flags(self) -> List[bool]:
+        """
+        Structural directoryness per item: an entry in the depth-preordered
+        list is a directory iff the next entry is deeper. Computed in one
+        linear sweep over the levels column so renderers index flags[i]
+        instead of peeking at the next item's level on every iteration.
+        Rebuilt lazily when the item list has grown, like levels.
+        """
+        if self._dir_flags_count != len(self.items):
+            levels = self.levels
+            n = len(levels)
+            flags = [False] * n
+            for i in range(n - 1):
+                flags[i] = levels[i + 1] > levels[i]
+            self._dir_flags = flags
+            self._dir_flags_count = n
+        return self._dir_flags
+
     def get_item(self, path: str) -> Optional[DirectoryItem]:
         """
         Get a directory item by path. Supports both full and relative paths.
@@ -64,19 +153,16 @@ class DirectoryStructure:
         Returns:
             Optional[DirectoryItem]: The directory item if found, None otherwise.
         """
+        self._ensure_index()
+
         # Try exact match first
-        for item in self.items:
-            if item.path == path:
-                return item
-                
+        item = self._by_path.get(path)
+        if item is not None:
+            return item
+
         # Try basename match if exact match fails
         search_name = path.rstrip('/').split('/')[-1]  # Simple path splitting
-        for item in self.items:
-            item_name = item.path.rstrip('/').split('/')[-1]
-            if item_name == search_name:
-                return item
-                
-        return None
+        return self._by_name.get(search_name)
     
     def get_files(self, exclusions: Optional[Union[List[IgnorePattern], List[str]]] = None, inclusions: Optional[Union[List[IgnorePattern], List[str]]] = None) -> List[DirectoryItem]:
         """
@@ -128,7 +214,8 @@ class DirectoryStructure:
         Returns:
             List[DirectoryItem]: The directory items at the specified level.
         """
-        return [item for item in self.items if item.level == level]
+        self._ensure_index()
+        return list(self._by_level.get(level, ()))
     
     def get_sub_items(self, path: str) -> List[DirectoryItem]:
         """
@@ -140,7 +227,18 @@ class DirectoryStructure:
         Returns:
             List[DirectoryItem]: The sub-items of the directory item.
         """
-        return [item for item in self.items if path in item.path and item.path != path]
+        self._ensure_index()
+        # Prefix match on the separator boundary: a plain substring test would
+        # match '/a/b' inside '/xa/b', and scanning every item is O(N). The
+        # sorted path list makes descendants a contiguous slice.
+        prefix = path.rstrip(os.sep) + os.sep
+        start = bisect_left(self._sorted_paths, prefix)
+        sub_items = []
+        for index in range(start, len(self._sorted_paths)):
+            if not self._sorted_paths[index].startswith(prefix):
+                break
+            sub_items.append(self._sorted_items[index])
+        return sub_items
     
     def get_item_names(self, level: int = -1) -> List[str]:
         """
@@ -205,11 +303,17 @@ class DirectoryStructure:
         Args:
             nested_dict (dict): Nested dictionary with __keys__ containing metadata
         """
-        def process_dict(current_dict: dict, current_path: str = "") -> None:
+        # Walk the nested dict iteratively with an explicit stack; recursion
+        # pays a Python frame per node and can overflow on very deep trees.
+        stack = deque([(nested_dict, "")])
+        while stack:
+            current_dict, current_path = stack.pop()
             for key, value in current_dict.items():
-                if not isinstance(value, dict):
+                # Identity check: template data only ever holds exact dicts,
+                # so skip isinstance's subclass/MRO walk per value.
+                if type(value) is not dict:
                     continue
-                    
+
                 # Build the full path for this item
                 path = os.path.join(current_path, key) if current_path else key
 
@@ -219,7 +323,7 @@ class DirectoryStructure:
 
                     if item:
                         keys_dict = value['__keys__']
-                        
+
                         # Update type if present
                         if 'type' in keys_dict and keys_dict['type'] is not None:
                             item.metadata['type'] = keys_dict['type']
@@ -239,12 +343,9 @@ class DirectoryStructure:
                         # Update tags if present
                         if 'tags' in keys_dict and keys_dict['tags'] is not None:
                             item.metadata['tags'] = keys_dict['tags']
-                
-                # Recursively process nested dictionaries
-                process_dict(value, path)
-        
-        # Start processing from root
-        process_dict(nested_dict)
+
+                # Queue nested dictionaries for processing
+                stack.append((value, path))
 
     def to_nested_dict(self, metadata_fields: Optional[List[str]] = None, use_json_style: bool = False) -> Dict[str, Union[Dict, None]]:
         """
@@ -264,36 +365,54 @@ class DirectoryStructure:
             from dirmapper_core.styles.json_style import JSONStyle
             return JSONStyle.write_structure(self)
 
-        # Legacy format
+        # Legacy format. Items arrive in walk (DFS) order, so consecutive
+        # paths share long prefixes; keeping the chain of open directory
+        # dicts on a stack avoids re-descending from the root per item.
         nested_dict = {}
+        chain_names: List[str] = []
+        chain_dicts: List[dict] = [nested_dict]
+        # Resolve the filtering mode once: with no field filter the per-item
+        # comprehension reduced to an expensive identity copy, and with one
+        # the membership test scanned a list per key.
+        include_all = metadata_fields is None
+        fields_set = set(metadata_fields) if metadata_fields else None
 
         for item in self.items:
-            parts = item.path.split(os.sep)
-            current_level = nested_dict
+            parts = item.parts
+            if not parts:
+                continue
+            dir_parts = parts[:-1]
 
-            # Navigate to the correct level
-            for part in parts[:-1]:
-                if part:  # Skip empty parts
-                    if part not in current_level:
-                        current_level[part] = {}
-                    current_level = current_level[part]
+            # Pop back to the longest common prefix with the previous item,
+            # then descend only the new components.
+            common = 0
+            max_common = min(len(dir_parts), len(chain_names))
+            while common < max_common and chain_names[common] == dir_parts[common]:
+                common += 1
+            del chain_names[common:]
+            del chain_dicts[common + 1:]
+            for part in dir_parts[common:]:
+                child = chain_dicts[-1].setdefault(part, {})
+                chain_names.append(part)
+                chain_dicts.append(child)
 
             # Add the final item with its metadata
-            if parts[-1]:  # Only process non-empty parts
-                current_level[parts[-1]] = {}
-                
-                # Handle metadata
-                if metadata_fields == []:
-                    current_level[parts[-1]]['__keys__'] = None
-                else:
-                    # If metadata_fields is None, include all fields
-                    fields_to_include = metadata_fields or item.metadata.keys()
-                    metadata = {
-                        k: v for k, v in item.metadata.items() 
-                        if k in fields_to_include
-                    }
-                    if metadata:
-                        current_level[parts[-1]]['__keys__'] = metadata
+            entry = {}
+            chain_dicts[-1][parts[-1]] = entry
+
+            # Handle metadata
+            if include_all:
+                if item.metadata:
+                    entry['__keys__'] = dict(item.metadata)
+            elif not fields_set:
+                entry['__keys__'] = None
+            else:
+                metadata = {
+                    k: v for k, v in item.metadata.items()
+                    if k in fields_set
+                }
+                if metadata:
+                    entry['__keys__'] = metadata
 
         return nested_dict
     
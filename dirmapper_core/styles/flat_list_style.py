@@ -63,14 +63,21 @@ class FlatListStyle(BaseStyle):
         root_item = DirectoryItem(path=root_path, level=0, name=root_path)
         structure.add_item(root_item)
 
+        # Paths under the root reduce to string slicing: os.path.relpath does
+        # cwd lookups and full normalization per call, which dominates parsing
+        # for long listings.
+        sep = os.sep
+        root_prefix = root_path.rstrip(sep) + sep
+
         for line in lines[1:]:
             path = line.strip()
-            # Calculate the relative path to the root directory
-            relative_path = os.path.relpath(path, start=root_path)
-            # Split the relative path into components
-            path_components = relative_path.split(os.sep)
-            level = len(path_components)
-            name = path_components[-1]
+            if path.startswith(root_prefix):
+                relative_path = path[len(root_prefix):]
+            else:
+                # Calculate the relative path to the root directory
+                relative_path = os.path.relpath(path, start=root_path)
+            level = relative_path.count(sep) + 1
+            name = relative_path.rsplit(sep, 1)[-1]
 
             # The path is already absolute
             item = DirectoryItem(path=path, level=level, name=name)
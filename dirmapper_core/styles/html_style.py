@@ -39,6 +39,26 @@ class HTMLStyle(BaseStyle):
                     </ul>
                 </ul>
         """
+        # Mark directories from the structure itself: anything that has a
+        # child in the listing (or ends with a separator) is a directory.
+        # os.path.isdir was one stat syscall per item and broke on trees that
+        # do not exist on the local filesystem.
+        sep = os.sep
+        dir_set = set()
+        for item_path, _, _ in structure:
+            stripped = item_path.rstrip(sep).rstrip('/')
+            if stripped != item_path:
+                dir_set.add(stripped)
+            parent = stripped.rsplit(sep, 1)[0]
+            if parent != stripped:
+                dir_set.add(parent)
+
+        # The relpath start never changes, so hoist the root prefix and reduce
+        # the common case to a string slice; os.path.relpath normalizes both
+        # paths on every call.
+        root = structure[0][0] if structure else ''
+        root_prefix = root.rstrip(sep).rstrip('/') + sep
+
         result = ['<ul>']
         previous_level = -1
 
@@ -46,15 +66,18 @@ class HTMLStyle(BaseStyle):
             if level > previous_level:
                 result.append('<ul>')
             elif level < previous_level:
-                result.append('</ul>' * (previous_level - level))
+                result.extend(['</ul>'] * (previous_level - level))
 
-            relative_path = os.path.relpath(item_path, start=structure[0][0])
-            if os.path.isdir(item_path):
+            if item_path.startswith(root_prefix):
+                relative_path = item_path[len(root_prefix):]
+            else:
+                relative_path = os.path.relpath(item_path, start=root)
+            if item_path.rstrip(sep).rstrip('/') in dir_set:
                 result.append(f'<li><a href="{relative_path}">{item}/</a></li>')
             else:
                 result.append(f'<li><a href="{relative_path}">{item}</a></li>')
 
             previous_level = level
 
-        result.append('</ul>' * (previous_level + 1))
+        result.extend(['</ul>'] * (previous_level + 1))
         return '\n'.join(result)
@@ -1,4 +1,6 @@
+import io
 import re
+import sys
 from typing import List, Tuple
 import os
 from dirmapper_core.models.directory_item import DirectoryItem
@@ -9,6 +11,12 @@ class IndentationStyle(BaseStyle):
     """
     IndentationStyle class for generating a directory structure in an indented format.
     """
+    # One compiled match per line replaces lstrip + length arithmetic +
+    # rstrip, i.e. three string allocations, on the parse hot path.
+    _INDENT_RE = re.compile(r'^( *)(.*?)/?$')
+    # '    ' * (level - 1) allocates a fresh string per row even though only
+    # a handful of distinct depths occur; render from this table instead.
+    _INDENTS = tuple('    ' * i for i in range(64))
     #TODO: Update this method to work with the template summarizer; see tree_style for details
     @staticmethod
     def write_structure(structure: DirectoryStructure, **kwargs) -> str:
@@ -43,17 +51,25 @@ class IndentationStyle(BaseStyle):
         """
         root_dir = kwargs.get('root_dir', '')
         items = structure.to_list()
-        result = []
+        indents = IndentationStyle._INDENTS
+        # Write fragments straight into a StringIO buffer: no per-row line
+        # string, no retained list of N strings for a final join to walk.
+        buf = io.StringIO()
+        write = buf.write
 
         for item in items:
             if item.level == 0:
                 # Root directory
-                result.append(f"{item.path}")
+                write(item.path)
+                write('\n')
                 continue
-            indent = '    ' * (item.level - 1)
-            result.append(f"{indent}{item.name}")
+            depth = item.level - 1
+            write(indents[depth] if depth < len(indents) else '    ' * depth)
+            write(item.name)
+            write('\n')
 
-        return '\n'.join(result)
+        result = buf.getvalue()
+        return result[:-1] if result else result
     
     @staticmethod
     def parse_from_style(indent_str: str) -> DirectoryStructure:
@@ -107,14 +123,16 @@ class IndentationStyle(BaseStyle):
         parent_paths = [root_name]  # parent_paths now starts with the absolute root directory
 
         for idx, line in enumerate(lines[1:], start=1):
-            stripped_line = line.lstrip()
-            indent_length = len(line) - len(stripped_line)
-            level = (indent_length // indent_unit) + 1  # +1 to account for root level
-
-            item_name = stripped_line.rstrip('/')
-
-            # Update parent_paths based on the current level
-            parent_paths = parent_paths[:level]
+            match = IndentationStyle._INDENT_RE.match(line)
+            indent, item_name = match.group(1), match.group(2)
+            # Common basenames repeat across many directories; interning
+            # keeps one string object per unique name.
+            item_name = sys.intern(item_name)
+            level = (len(indent) // indent_unit) + 1  # +1 to account for root level
+
+            # Update parent_paths based on the current level (truncate in
+            # place; a slice would copy the stack for every line)
+            del parent_paths[level:]
             parent_paths.append(item_name)
 
             # Build the absolute path by joining the root directory and the relative components
@@ -1,6 +1,12 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 import os
 import platform
+import stat as stat_module
+import sys
+import time
 from typing import List, Tuple
 from dirmapper_core.models.directory_item import DirectoryItem
 from dirmapper_core.models.directory_structure import DirectoryStructure
@@ -11,6 +17,169 @@ if platform.system() != "Windows":
     import pwd
     import grp
 
+    # Most trees are owned by a handful of uids/gids, but getpwuid/getgrgid
+    # re-resolve through NSS (potentially a network roundtrip) on every call.
+    # Ids with no passwd/group entry (containers, detached NFS ids) fall back
+    # to the numeric id instead of raising KeyError out of get_metadata.
+    @lru_cache(maxsize=256)
+    def _uid_name(uid: int) -> str:
+        try:
+            return pwd.getpwuid(uid).pw_name
+        except KeyError:
+            return str(uid)
+
+    @lru_cache(maxsize=256)
+    def _gid_name(gid: int) -> str:
+        try:
+            return grp.getgrgid(gid).gr_name
+        except KeyError:
+            return str(gid)
+
+    def _owner_group(stats: os.stat_result) -> Tuple[str, str]:
+        return _uid_name(stats.st_uid), _gid_name(stats.st_gid)
+else:
+    def _owner_group(stats: os.stat_result) -> Tuple[str, str]:
+        # Group info is not available on Windows; fall back to the current
+        # login for the author.
+        return os.getlogin(), "unknown"
+
+# Shared all-None content placeholders: most nodes in a large tree carry no
+# content or summaries, and a fresh 2-3 key dict per node is pure allocation
+# churn. Treat these as frozen — consumers must replace, never mutate, them
+# (the summarizer merge copies before writing for exactly this reason). They
+# stay plain dicts rather than MappingProxyType so the rendered tree remains
+# directly JSON-serializable.
+_EMPTY_FILE_CONTENT = {
+    "file_content": None,
+    "content_summary": None,
+    "short_summary": None
+}
+_EMPTY_DIR_CONTENT = {
+    "content_summary": None,
+    "short_summary": None
+}
+
+# get_metadata builds one of these per entry; a single key tuple zipped with
+# a value tuple replaces three copies of the same 7-key dict literal.
+_META_KEYS = ("type", "relative_path", "creation_date", "last_modified",
+              "author", "last_modified_by", "size")
+
+# Fixed metadata values, interned so every entry in a large output references
+# one shared string object each. Literals are only guaranteed shared within a
+# single code object; interning makes the guarantee process-wide, which also
+# lets downstream comparisons hit the pointer-equality fast path.
+_DIRECTORY = sys.intern("directory")
+_FILE = sys.intern("file")
+_PERMISSION_DENIED = sys.intern("permission_denied")
+_UNKNOWN = sys.intern("unknown")
+
+@lru_cache(maxsize=4096)
+def _iso_timestamp(ts: float) -> str:
+    """
+    ISO-format an epoch timestamp, caching the result. fromtimestamp +
+    isoformat allocates a datetime and re-formats per call, and trees written
+    in bulk (checkouts, builds, syncs) repeat the same handful of timestamps
+    across thousands of entries.
+    """
+    return datetime.fromtimestamp(ts).isoformat()
+
+@lru_cache(maxsize=16)
+def _root_prefix(root_path: str) -> str:
+    """Normalized ``root + os.sep`` prefix, built once per distinct root."""
+    return root_path.rstrip(os.sep) + os.sep
+
+def _relative_to_root(path: str, root_path: str) -> str:
+    """
+    Relative path of ``path`` under ``root_path``. Item paths almost always
+    start with the root, so a prefix strip (one C-level startswith + slice)
+    replaces os.path.relpath, which splits both paths and walks their
+    components in pure Python. Paths outside the root still go through
+    relpath for the '..' handling.
+    """
+    root_prefix = _root_prefix(root_path)
+    if path.startswith(root_prefix):
+        # The root itself (with a trailing separator) strips to nothing;
+        # relpath spells that '.'.
+        return path[len(root_prefix):] or '.'
+    if path.rstrip(os.sep) == root_path.rstrip(os.sep):
+        return '.'
+    return os.path.relpath(path, start=root_path)
+
+def _placeholder_meta(is_dir: bool, relative_path: str, placeholder: str) -> dict:
+    """Metadata dict for paths that could not be statted."""
+    return dict(zip(_META_KEYS, (
+        _DIRECTORY if is_dir else _FILE,
+        relative_path,
+        placeholder, placeholder, placeholder, placeholder,
+        0
+    )))
+
+# Opt-in metadata cache for callers that render the same tree repeatedly
+# (watchers, audit loops): (path, root_path) -> (expiry, meta dict). The
+# root is part of the key because the cached dict embeds relative_path,
+# which differs per root. Disabled unless a positive ttl is passed, so
+# one-shot renders always see fresh metadata.
+_META_CACHE: dict = {}
+
+# Once the cache reaches this many entries, inserts first sweep out expired
+# entries and then evict oldest-inserted ones, so stale entries cannot
+# accumulate without bound across long-lived processes.
+_META_CACHE_MAX = 32768
+
+# Below this many paths the thread-pool startup costs more than it saves.
+_BATCH_STAT_PARALLEL_MIN = 512
+
+# Minimum number of pending file reads before prefetching them concurrently.
+_CONTENT_PREFETCH_MIN = 8
+
+def _prefetch_content(items) -> None:
+    """
+    Load (and cache) file content for every item that still needs it, with
+    reads issued concurrently. File I/O releases the GIL, so overlapping the
+    reads hides per-file latency; the content property caches the result, so
+    the later assembly loop becomes a pure in-memory pass.
+    """
+    pending = [item for item in items
+               if 'content' in item.metadata and item.metadata.get('content') is None]
+    if len(pending) < _CONTENT_PREFETCH_MIN:
+        return
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        for _ in executor.map(lambda item: item.content, pending):
+            pass
+
+def _try_stat(path: str):
+    try:
+        return path, os.stat(path)
+    except OSError:
+        return path, None
+
+def _batch_stat(paths) -> dict:
+    """
+    Stat every path once in a single pre-pass and return a path -> stat_result
+    mapping. Paths that cannot be statted are simply absent so callers fall
+    back to their own (error-classifying) stat call.
+
+    Large batches are statted concurrently: os.stat releases the GIL and the
+    pre-pass is pure syscall latency, so a thread pool overlaps the waits
+    (which dominates on networked filesystems). Rendering itself stays
+    single-threaded — it is CPU-bound Python where threads cannot help.
+    """
+    paths = list(paths)
+    results = {}
+    if len(paths) >= _BATCH_STAT_PARALLEL_MIN:
+        with ThreadPoolExecutor(max_workers=32) as executor:
+            for path, stats in executor.map(_try_stat, paths, chunksize=64):
+                if stats is not None:
+                    results[path] = stats
+        return results
+    _stat = os.stat
+    for path in paths:
+        try:
+            results[path] = _stat(path)
+        except OSError:
+            continue
+    return results
+
 class JSONStyle(BaseStyle):
     """
     JSONStyle is a concrete class that inherits from the BaseStyle class. It provides an implementation for the write_structure method that converts a directory structure into a JSON representation.
@@ -28,6 +197,7 @@ class JSONStyle(BaseStyle):
                 root_dir (str): The root directory path (optional, if not provided uses the first item's path).
                 include_content (bool): If True, attempt to load file content from the file system.
                 generate_content (bool): If True, attempt to generate file content via OpenAI if no existing content is found.
+                metadata_ttl (float): If positive, cache per-path metadata for this many seconds across calls (see get_metadata).
 
         Returns:
             dict: A JSON representation of the directory structure with metadata.
@@ -35,6 +205,7 @@ class JSONStyle(BaseStyle):
         root_dir = kwargs.get('root_dir')
         include_content = kwargs.get('include_content', False)
         generate_content = kwargs.get('generate_content', False)
+        meta_ttl = kwargs.get('metadata_ttl', 0)
 
         items = structure.to_list()
         if not items:
@@ -47,15 +218,34 @@ class JSONStyle(BaseStyle):
         if not root_dir:
             root_dir = root_item.path
 
-        # Get metadata for the root directory
-        root_metadata = JSONStyle.get_metadata(root_item.path, True, root_dir)
+        # One stat per path up front: the per-item loop below otherwise pays
+        # two syscalls per entry (os.path.isdir plus os.stat in get_metadata).
+        # Items whose walker already captured a stat_result are skipped here.
+        stats_by_path = _batch_stat(item.path for item in items
+                                    if item.stat_result is None)
+
+        if include_content:
+            _prefetch_content(items[1:])
+
+        # Get metadata for the root directory. The root is covered by the
+        # same batched stat pass as every other item, so no path is statted
+        # more than once across the root handling and the loop below.
+        root_stats = root_item.stat_result or stats_by_path.get(root_item.path)
+        root_metadata = JSONStyle.get_metadata(root_item.path, True, root_dir,
+                                               stats=root_stats, ttl=meta_ttl)
+        root_summary = root_item.metadata.get("summary")
+        root_short_summary = root_item.metadata.get("short_summary")
+        if root_summary is None and root_short_summary is None:
+            root_content = _EMPTY_DIR_CONTENT
+        else:
+            root_content = {
+                "content_summary": root_summary,
+                "short_summary": root_short_summary
+            }
         root_dict = {
             "__keys__": {
                 "meta": root_metadata,
-                "content": {
-                    "content_summary": root_item.metadata.get("summary"),
-                    "short_summary": root_item.metadata.get("short_summary")
-                }
+                "content": root_content
             }
         }
 
@@ -65,45 +255,99 @@ class JSONStyle(BaseStyle):
             f"{root_dir}/": root_dict
         }
 
-        # Process all items except the first (root) one
-        for item in items[1:]:
-            is_dir = os.path.isdir(item.path)
-            metadata = JSONStyle.get_metadata(item.path, is_dir, root_dir)
-
-            # Compute relative path from root
-            relative_path = os.path.relpath(item.path, start=root_dir)
-            parts = relative_path.split(os.sep)
-
-            # Navigate under the root directory key
-            current = root_dict
-            for part in parts[:-1]:
+        # Process all items except the first (root) one. Items arrive in walk
+        # (DFS) order, so consecutive relative paths share long prefixes;
+        # keeping the chain of open directory dicts on a stack avoids
+        # re-descending from the root dict for every item.
+        chain_parts: List[str] = []
+        chain_dicts: List[dict] = [root_dict]
+        # Relative components come from the parts tuple each DirectoryItem
+        # split at construction; os.path.relpath + split would re-split both
+        # paths per item.
+        root_parts = tuple(part for part in root_dir.split(os.sep) if part)
+        n_root = len(root_parts)
+        sep = os.sep
+        root_prefix = _root_prefix(root_dir)
+        # The depth-preordered structure already encodes directoryness (an
+        # entry is a directory iff the next entry is deeper); the precomputed
+        # flags column replaces a failed-stat syscall per item for structures
+        # that do not exist on disk (e.g. parsed templates).
+        dir_flags = structure.dir_flags
+        n_items = len(items)
+        # The loop body is pure-Python dict assembly; keep its name lookups
+        # on locals so each iteration skips the module/class attribute walks.
+        stats_get = stats_by_path.get
+        s_isdir = stat_module.S_ISDIR
+        get_metadata = JSONStyle.get_metadata
+        for i in range(1, n_items):
+            item = items[i]
+            item_stats = item.stat_result
+            if item_stats is None:
+                item_stats = stats_get(item.path)
+            if item_stats is not None:
+                is_dir = s_isdir(item_stats.st_mode)
+            else:
+                is_dir = dir_flags[i]
+            metadata = get_metadata(item.path, is_dir, root_dir, stats=item_stats,
+                                    ttl=meta_ttl)
+
+            # Compute relative components from root
+            item_parts = item.parts
+            if len(item_parts) > n_root and item_parts[:n_root] == root_parts:
+                parts = item_parts[n_root:]
+            else:
+                # Item lives outside root_dir (or at it); fall back to relpath
+                parts = tuple(os.path.relpath(item.path, start=root_dir).split(os.sep))
+            dir_parts = parts[:-1]
+
+            # Pop back to the longest common prefix with the previous item,
+            # then descend only the new components.
+            common = 0
+            max_common = min(len(dir_parts), len(chain_parts))
+            while common < max_common and chain_parts[common] == dir_parts[common]:
+                common += 1
+            del chain_parts[common:]
+            del chain_dicts[common + 1:]
+            for j in range(common, len(dir_parts)):
+                part = dir_parts[j]
                 dir_key = part + '/'
-                if dir_key not in current:
-                    # Create a placeholder for intermediate directories without __keys__
-                    mid_path = os.path.join(root_dir, *parts[:parts.index(part)+1])
-                    mid_meta = JSONStyle.get_metadata(mid_path, True, root_dir)
-                    current[dir_key] = {
+                child = chain_dicts[-1].get(dir_key)
+                if child is None:
+                    # Create a placeholder for intermediate directories without
+                    # __keys__. Components never contain separators here, so a
+                    # plain concat replaces os.path.join's normalization loop.
+                    mid_path = root_prefix + sep.join(dir_parts[:j + 1])
+                    mid_meta = JSONStyle.get_metadata(mid_path, True, root_dir,
+                                                      stats=stats_by_path.get(mid_path),
+                                                      ttl=meta_ttl)
+                    child = {
                         "__keys__": {
                             "meta": mid_meta,
-                            "content": {
-                                "content_summary": None,
-                                "short_summary": None
-                            }
+                            "content": _EMPTY_DIR_CONTENT
                         }
                     }
-                current = current[dir_key]
+                    chain_dicts[-1][dir_key] = child
+                chain_parts.append(part)
+                chain_dicts.append(child)
+            current = chain_dicts[-1]
 
             # Handle the last part
             last_part = parts[-1]
+            summary = item.metadata.get("summary")
+            short_summary = item.metadata.get("short_summary")
             if is_dir:
                 folder_key = last_part + '/'
+                if summary is None and short_summary is None:
+                    content_dict = _EMPTY_DIR_CONTENT
+                else:
+                    content_dict = {
+                        "content_summary": summary,
+                        "short_summary": short_summary
+                    }
                 current[folder_key] = {
                     "__keys__": {
                         "meta": metadata,
-                        "content": {
-                            "content_summary": item.metadata.get("summary"),
-                            "short_summary": item.metadata.get("short_summary")
-                        }
+                        "content": content_dict
                     }
                 }
             else:
@@ -114,72 +358,255 @@ class JSONStyle(BaseStyle):
                     if content is None and generate_content:
                         content = JSONStyle.generate_file_content(item.path, items, root_dir)
 
+                if content is None and summary is None and short_summary is None:
+                    content_dict = _EMPTY_FILE_CONTENT
+                else:
+                    content_dict = {
+                        "file_content": content,
+                        "content_summary": summary,
+                        "short_summary": short_summary
+                    }
                 current[last_part] = {
                     "__keys__": {
                         "meta": metadata,
-                        "content": {
-                            "file_content": content,
-                            "content_summary": item.metadata.get("summary"),
-                            "short_summary": item.metadata.get("short_summary")
-                        }
+                        "content": content_dict
                     }
                 }
 
         return nested_dict
     
-    def get_metadata(path: str, is_dir: bool, root_path: str) -> dict:
+    @staticmethod
+    async def write_structure_async(structure: DirectoryStructure, **kwargs) -> dict:
+        """
+        Coroutine counterpart of write_structure for asyncio callers.
+
+        The render is handed to a worker thread so the event loop stays
+        responsive while the stat pre-pass and content prefetch run; those
+        phases already issue their syscalls concurrently through internal
+        thread pools, which is where the latency win on high-latency
+        filesystems (NFS, FUSE mounts) comes from.
+
+        Args:
+            structure (DirectoryStructure): The directory structure to convert.
+            **kwargs: Same options as write_structure.
+
+        Returns:
+            dict: A JSON representation of the directory structure with metadata.
+        """
+        return await asyncio.to_thread(JSONStyle.write_structure, structure, **kwargs)
+
+    @staticmethod
+    def write_structure_iter(structure: DirectoryStructure, **kwargs):
+        """
+        Stream the directory structure as flat events instead of materializing
+        the nested dict that write_structure returns. Memory stays O(depth)
+        regardless of tree size, so callers can serialize arbitrarily large
+        trees straight to a file or socket.
+
+        Yields:
+            tuple: ('enter', level, name, keys) when a directory opens,
+                ('file', level, name, keys) for each file, and
+                ('exit', level, name, None) when a directory closes.
+                ``keys`` matches the "__keys__" payload of write_structure
+                (metadata under 'meta', content placeholders under 'content').
+
+        Args:
+            structure (DirectoryStructure): The directory structure to stream.
+            **kwargs:
+                root_dir (str): The root directory path (optional, defaults to
+                    the first item's path).
+        """
+        root_dir = kwargs.get('root_dir')
+
+        items = structure.to_list()
+        if not items:
+            return
+
+        root_item = items[0]
+        if root_item.level != 0:
+            raise ValueError("The first item in the structure must be the root directory with level 0.")
+        if not root_dir:
+            root_dir = root_item.path
+
+        stats_by_path = _batch_stat(item.path for item in items
+                                    if item.stat_result is None)
+        levels = structure.levels
+        dir_flags = structure.dir_flags
+        n_items = len(items)
+
+        root_summary = root_item.metadata.get("summary")
+        root_short_summary = root_item.metadata.get("short_summary")
+        if root_summary is None and root_short_summary is None:
+            root_content = _EMPTY_DIR_CONTENT
+        else:
+            root_content = {
+                "content_summary": root_summary,
+                "short_summary": root_short_summary
+            }
+        root_stats = root_item.stat_result or stats_by_path.get(root_item.path)
+        root_keys = {
+            "meta": JSONStyle.get_metadata(root_item.path, True, root_dir,
+                                           stats=root_stats),
+            "content": root_content
+        }
+        yield ('enter', 0, f"{root_dir}/", root_keys)
+        open_dirs = [(0, f"{root_dir}/")]
+
+        for i in range(1, n_items):
+            item = items[i]
+            item_stats = item.stat_result
+            if item_stats is None:
+                item_stats = stats_by_path.get(item.path)
+            if item_stats is not None:
+                is_dir = stat_module.S_ISDIR(item_stats.st_mode)
+            else:
+                is_dir = dir_flags[i]
+
+            level = levels[i]
+            while len(open_dirs) > 1 and open_dirs[-1][0] >= level:
+                closed_level, closed_name = open_dirs.pop()
+                yield ('exit', closed_level, closed_name, None)
+
+            metadata = JSONStyle.get_metadata(item.path, is_dir, root_dir, stats=item_stats)
+            summary = item.metadata.get("summary")
+            short_summary = item.metadata.get("short_summary")
+            if is_dir:
+                if summary is None and short_summary is None:
+                    content_dict = _EMPTY_DIR_CONTENT
+                else:
+                    content_dict = {
+                        "content_summary": summary,
+                        "short_summary": short_summary
+                    }
+                name = item.name + '/'
+                yield ('enter', level, name, {"meta": metadata, "content": content_dict})
+                open_dirs.append((level, name))
+            else:
+                if summary is None and short_summary is None:
+                    content_dict = _EMPTY_FILE_CONTENT
+                else:
+                    content_dict = {
+                        "file_content": None,
+                        "content_summary": summary,
+                        "short_summary": short_summary
+                    }
+                yield ('file', level, item.name, {"meta": metadata, "content": content_dict})
+
+        while open_dirs:
+            closed_level, closed_name = open_dirs.pop()
+            yield ('exit', closed_level, closed_name, None)
+
+    @staticmethod
+    def write_structure_flat(structure: DirectoryStructure, **kwargs) -> dict:
+        """
+        Render the structure in a compact list-based layout:
+
+            {"name": ..., "_meta": {...}, "_content": {...}, "_children": [...]}
+
+        Compared to the canonical __keys__ schema this drops the wrapper dict
+        per node and keeps children in a list, which C encoders like orjson
+        serialize faster than dicts (no key hashing) and which lazy consumers
+        can walk without knowing the child names up front. The canonical
+        schema is unchanged — parse_from_style and the template tooling keep
+        reading the __keys__ form.
+
+        Args:
+            structure (DirectoryStructure): The directory structure to convert.
+            **kwargs: Same options as write_structure_iter.
+
+        Returns:
+            dict: The root node of the compact layout.
+        """
+        root = None
+        open_dirs: List[dict] = []
+        for event, level, name, keys in JSONStyle.write_structure_iter(structure, **kwargs):
+            if event == 'exit':
+                open_dirs.pop()
+                continue
+            node = {
+                "name": name[:-1] if name.endswith('/') else name,
+                "_meta": keys["meta"],
+                "_content": keys["content"],
+            }
+            if event == 'enter':
+                node["_children"] = []
+            if open_dirs:
+                open_dirs[-1]["_children"].append(node)
+            else:
+                root = node
+            if event == 'enter':
+                open_dirs.append(node)
+        return root or {}
+
+    def get_metadata(path: str, is_dir: bool, root_path: str, stats: os.stat_result = None,
+                     ttl: float = 0) -> dict:
         """
-        Retrieves real metadata for a given file or directory path.
+        Retrieves real metadata for a given file or directory path. A
+        pre-fetched ``stats`` result (e.g. from a batched stat pass) is used
+        as-is so the path is not statted a second time.
+
+        A positive ``ttl`` (seconds) caches the result per path, so callers
+        that render the same tree repeatedly skip the stat and the owner
+        lookups for unchanged paths until the entry expires. The default of 0
+        disables caching; cached metadata can be up to ttl seconds stale.
         """
+        if ttl > 0:
+            cached = _META_CACHE.get((path, root_path))
+            if cached is not None and time.monotonic() < cached[0]:
+                return cached[1]
         try:
-            stats = os.stat(path)
+            if stats is None:
+                stats = os.stat(path)
+
+            # The mode bits of the single stat are authoritative; the caller's
+            # is_dir flag only decides the type when the path cannot be
+            # statted at all (the except branches below).
+            is_dir = stat_module.S_ISDIR(stats.st_mode)
 
             # Metadata values
-            creation_date = datetime.fromtimestamp(stats.st_ctime).isoformat()
-            last_modified = datetime.fromtimestamp(stats.st_mtime).isoformat()
+            creation_date = _iso_timestamp(stats.st_ctime)
+            last_modified = _iso_timestamp(stats.st_mtime)
             size = stats.st_size if not is_dir else 0  # Size for files only
 
-            # Cross-platform handling for author and last modified by
-            if platform.system() == "Windows":
-                author = os.getlogin()  # Fallback to current user on Windows
-                last_modified_by = "unknown"  # Group info not available on Windows
-            else:
-                # Use Unix-specific modules for author and group
-                author = pwd.getpwuid(stats.st_uid).pw_name
-                last_modified_by = grp.getgrgid(stats.st_gid).gr_name
+            # Cross-platform author/group resolution, bound once at import:
+            # the platform never changes mid-process, so the per-file
+            # platform.system() call and string compare buy nothing.
+            author, last_modified_by = _owner_group(stats)
 
             # Calculate relative path from the root directory
-            relative_path = os.path.relpath(path, start=root_path)
-
-            return {
-                "type": "directory" if is_dir else "file",
-                "relative_path": relative_path,
-                "creation_date": creation_date,
-                "last_modified": last_modified,
-                "author": author,
-                "last_modified_by": last_modified_by,
-                "size": size
-            }
+            relative_path = _relative_to_root(path, root_path)
+
+            meta = dict(zip(_META_KEYS, (
+                _DIRECTORY if is_dir else _FILE,
+                relative_path,
+                creation_date,
+                last_modified,
+                author,
+                last_modified_by,
+                size
+            )))
         except PermissionError:
-            return {
-                "type": "directory" if is_dir else "file",
-                "relative_path": os.path.relpath(path, start=root_path),
-                "creation_date": "permission_denied",
-                "last_modified": "permission_denied",
-                "author": "permission_denied",
-                "last_modified_by": "permission_denied",
-                "size": 0
-            }
+            meta = _placeholder_meta(is_dir, _relative_to_root(path, root_path),
+                                     _PERMISSION_DENIED)
         except FileNotFoundError:
-            return {
-                "type": "directory" if is_dir else "file",
-                "relative_path": os.path.relpath(path, start=root_path),
-                "creation_date": "unknown",
-                "last_modified": "unknown",
-                "author": "unknown",
-                "last_modified_by": "unknown",
-                "size": 0
-            }
+            meta = _placeholder_meta(is_dir, _relative_to_root(path, root_path),
+                                     _UNKNOWN)
+        if ttl > 0:
+            now = time.monotonic()
+            if len(_META_CACHE) >= _META_CACHE_MAX:
+                for key in [key for key, entry in _META_CACHE.items() if entry[0] <= now]:
+                    del _META_CACHE[key]
+                # Still full with live entries: evict oldest-inserted (FIFO;
+                # dicts preserve insertion order) to keep the cache bounded.
+                while len(_META_CACHE) >= _META_CACHE_MAX:
+                    del _META_CACHE[next(iter(_META_CACHE))]
+            _META_CACHE[(path, root_path)] = (now + ttl, meta)
+        return meta
+
+    @staticmethod
+    def clear_metadata_cache() -> None:
+        """Drop every cached get_metadata entry regardless of expiry."""
+        _META_CACHE.clear()
     
     @staticmethod
     def parse_from_style(json_dict: dict) -> DirectoryStructure:
@@ -210,11 +637,6 @@ class JSONStyle(BaseStyle):
         root_item = DirectoryItem(path=root_path, level=0, name=root_path, metadata=root_meta)
         structure.add_item(root_item)
 
-        # Remove __keys__ so we can parse the contents
-        if "__keys__" in root_obj:
-            del root_obj["__keys__"]
-
-        # Recursively parse the structure
         structure.items.extend(JSONStyle._traverse_json(root_obj, level=1, parent_path=root_path))
 
         return structure
@@ -222,42 +644,58 @@ class JSONStyle(BaseStyle):
     @staticmethod
     def _traverse_json(node: dict, level: int, parent_path: str) -> List[DirectoryItem]:
         """
-        Recursively traverses the JSON/dict structure to build the list of DirectoryItem objects.
-        
+        Traverses the JSON/dict structure to build the list of DirectoryItem objects.
+
+        The walk is depth-first but iterative: a stack of live dict iterators
+        replaces recursion (a Python frame plus two list allocations per
+        directory, and a RecursionError risk on deep trees) and everything is
+        appended to one result list. __keys__ entries are skipped in place,
+        so directory nodes no longer need a copy-and-delete pass each.
+
         Args:
             node (dict): The current dictionary node representing files/directories.
             level (int): The current level in the directory hierarchy.
             parent_path (str): The absolute path to the parent directory.
 
         Returns:
-            List[DirectoryItem]: A list of DirectoryItem objects.
+            List[DirectoryItem]: A list of DirectoryItem objects in preorder.
         """
         structure = []
-        for key, value in node.items():
-            if key == '__keys__':
-                # Already handled at higher level, skip
-                continue
-
-            is_dir = key.endswith('/')
-            item_name = key.rstrip('/')
-            item_path = os.path.join(parent_path, item_name)
-
-            # Extract __keys__ if present
-            item_keys = {}
-            item_meta = {}
-            if isinstance(value, dict) and "__keys__" in value:
-                item_keys = value["__keys__"]
-                item_meta = item_keys.get("meta", {})
-            
-            item = DirectoryItem(path=item_path, level=level, name=item_name, metadata=item_meta)
-            structure.append(item)
-
-            if is_dir:
-                # It's a directory, recurse deeper
-                sub_node = value.copy()
-                if "__keys__" in sub_node:
-                    del sub_node["__keys__"]
-                structure.extend(JSONStyle._traverse_json(sub_node, level + 1, item_path))
+        # Keys never contain separators, so a plain concat replaces the
+        # os.path.join call (and its normalization loop) per entry.
+        sep = os.sep
+        stack = [(iter(node.items()), level, parent_path)]
+        while stack:
+            iterator, cur_level, cur_parent = stack[-1]
+            for key, value in iterator:
+                if key == '__keys__':
+                    # Already handled at higher level, skip
+                    continue
+
+                # One last-char check decides both questions; rstrip would
+                # allocate a copy even for keys with no trailing slash.
+                is_dir = key[-1:] == '/'
+                # Common basenames repeat across many directories; interning
+                # keeps one string object per unique name.
+                item_name = sys.intern(key[:-1] if is_dir else key)
+                item_path = cur_parent + sep + item_name
+
+                # Extract __keys__ if present (identity check: JSON-decoded
+                # nodes are always exact dicts)
+                item_meta = {}
+                if type(value) is dict and "__keys__" in value:
+                    item_meta = value["__keys__"].get("meta", {})
+
+                structure.append(DirectoryItem(path=item_path, level=cur_level,
+                                               name=item_name, metadata=item_meta))
+
+                if is_dir:
+                    # Descend; this frame's iterator resumes once the
+                    # subdirectory is exhausted.
+                    stack.append((iter(value.items()), cur_level + 1, item_path))
+                    break
+            else:
+                stack.pop()
 
         return structure
     
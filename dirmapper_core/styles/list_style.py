@@ -1,3 +1,5 @@
+import io
+import sys
 from typing import List, Tuple
 import os
 from dirmapper_core.models.directory_item import DirectoryItem
@@ -8,6 +10,9 @@ class ListStyle(BaseStyle):
     """
     ListStyle class for generating a directory structure in a list format.
     """
+    # '    ' * (level - 1) allocates a fresh string per row even though only
+    # a handful of distinct depths occur; render from this table instead.
+    _INDENTS = tuple('    ' * i for i in range(64))
     @staticmethod
     def write_structure(structure: DirectoryStructure, **kwargs) -> str:
         """
@@ -42,20 +47,36 @@ class ListStyle(BaseStyle):
                 - sub_dir3/
                     - file5.txt
         """
-        root_dir = kwargs.get('root_dir', '')  # Get root_dir from kwargs if needed
-        result = []
-        for item in structure.to_list():
+        # Decide directoryness from the structure itself — the type recorded
+        # during the walk, or failing that the precomputed structural flag —
+        # instead of a stat syscall per row.
+        items = structure.to_list()
+        dir_flags = structure.dir_flags
+        indents = ListStyle._INDENTS
+        # Write fragments straight into a StringIO buffer: no per-row line
+        # string, no retained list of N strings for a final join to walk.
+        buf = io.StringIO()
+        write = buf.write
+        for i, item in enumerate(items):
             if item.level == 0:
                 # Root directory
-                result.append(f"{item.path}")
+                write(item.path)
+                write('\n')
                 continue
-            indent = '    ' * (item.level - 1)  # Adjust indentation
-            full_item_path = os.path.join(root_dir, item.path)
-            if os.path.isdir(full_item_path):
-                result.append(f"{indent}- {item.name}/")
+            depth = item.level - 1
+            write(indents[depth] if depth < len(indents) else '    ' * depth)
+            write('- ')
+            write(item.name)
+            meta_type = item.metadata.get('type')
+            if meta_type is not None:
+                is_dir = meta_type == 'directory'
             else:
-                result.append(f"{indent}- {item.name}")
-        return '\n'.join(result)
+                is_dir = dir_flags[i]
+            if is_dir:
+                write('/')
+            write('\n')
+        result = buf.getvalue()
+        return result[:-1] if result else result
         
     @staticmethod
     def parse_from_style(list_str: str) -> List[Tuple[str, int, str]]:
@@ -68,59 +89,72 @@ class ListStyle(BaseStyle):
         Returns:
             DirectoryStructure: The parsed directory structure.
         """
-        lines = list_str.splitlines()
         structure = DirectoryStructure()
         parent_paths = []
         root_processed = False
+        root_dir = None
+        # Names never contain separators, so plain concatenation replaces
+        # os.path.join's normalization logic on the per-line path build.
+        sep = os.sep
 
-        # Preprocess lines to get levels
-        levels = []
-        for line in lines:
-            stripped_line = line.lstrip()
-            indent_length = len(line) - len(stripped_line)
-            level = indent_length // 4  # Each level of indentation is 4 spaces
-            levels.append(level)
-
-        for i, line in enumerate(lines):
-            # Determine the level based on indentation
-            stripped_line = line.lstrip()
-            indent_length = len(line) - len(stripped_line)
-            level = indent_length // 4  # Each level of indentation is 4 spaces
-
-            # Remove the '- ' prefix and trailing '/' for directories
-            item_name = stripped_line.lstrip('- ').rstrip('/')
-            # Assume items with child items are directories
-            if i + 1 < len(lines) and levels[i + 1] > level:
-                is_folder = True
-            else:
-                is_folder = False
+        def emit(level: int, stripped_line: str, is_folder: bool) -> None:
+            nonlocal root_processed, root_dir
+            # Remove the '- ' prefix and trailing '/' for directories. The
+            # prefix is a fixed two characters, so slice it off; lstrip('- ')
+            # treats the argument as a charset and would mangle names that
+            # start with '-' or have leading spaces baked in.
+            item_name = stripped_line[2:] if stripped_line.startswith('- ') else stripped_line
+            if item_name[-1:] == '/':
+                item_name = item_name[:-1]
+            # Common basenames repeat across many directories; interning
+            # keeps one string object per unique name.
+            item_name = sys.intern(item_name)
 
             if not root_processed:
                 # Process the first line as the root item
-                current_path = os.path.join(root_dir, item_name.rstrip('/'))
-                parent_paths = [current_path]
-                root_dir = current_path  # Set root_dir to current_path
-                structure.add_item(DirectoryItem(current_path, 0, item_name))
+                parent_paths.append(item_name)
+                root_dir = item_name
+                structure.add_item(DirectoryItem(item_name, 0, item_name,
+                                                 metadata={'type': 'directory'}))
                 root_processed = True
-                continue
+                return
+
+            # For subsequent lines
+            level += 1  # Adjust level to account for root
+            # Update parent_paths stack (truncate in place; a slice
+            # would copy the stack for every line)
+            if level <= len(parent_paths):
+                del parent_paths[level - 1:]
+            if parent_paths:
+                current_path = parent_paths[-1] + sep + item_name
             else:
-                # For subsequent lines
-                level += 1  # Adjust level to account for root
-                # Update parent_paths stack
-                if level <= len(parent_paths):
-                    parent_paths = parent_paths[:level - 1]
-                if parent_paths:
-                    current_path = os.path.join(parent_paths[-1], item_name.rstrip('/'))
-                else:
-                    current_path = os.path.join(root_dir, item_name.rstrip('/'))
+                current_path = root_dir + sep + item_name
 
-                if is_folder:
-                    parent_paths.append(current_path)
+            if is_folder:
+                parent_paths.append(current_path)
 
-                # Compute the relative path to the root directory
-                relative_current_path = os.path.relpath(current_path, start=root_dir) # Not Used, Returning Full Path instead
+            # Add the item to the structure. Record directoryness from the
+            # parse itself; otherwise the constructor falls back to an
+            # on-disk stat, which calls every path that does not exist a
+            # directory.
+            structure.add_item(DirectoryItem(
+                current_path, level, item_name,
+                metadata={'type': 'directory' if is_folder else 'file'}))
 
-                # Add the item to the structure
-                structure.add_item(DirectoryItem(current_path, level, item_name))
+        # Single fused pass: each line is stripped and measured exactly once,
+        # and its emission is deferred until the next line's level is known
+        # (an item is a folder iff the line after it is deeper). This
+        # replaces a separate preprocessing pass that kept a (level,
+        # stripped) tuple per line alive for the whole parse.
+        prev_level = prev_line = None
+        for line in list_str.splitlines():
+            stripped_line = line.lstrip()
+            level = (len(line) - len(stripped_line)) // 4  # 4 spaces per level
+            if prev_line is not None:
+                emit(prev_level, prev_line, level > prev_level)
+            prev_level, prev_line = level, stripped_line
+        if prev_line is not None:
+            # The last line has nothing after it, so it cannot be a folder.
+            emit(prev_level, prev_line, False)
 
         return structure
@@ -1,4 +1,6 @@
+import io
 import re
+import sys
 from typing import List, Optional, Tuple
 import os
 from dirmapper_core.models.directory_item import DirectoryItem
@@ -10,6 +12,9 @@ class TreeStyle(BaseStyle):
     """
     TreeStyle class for generating a directory structure in a tree format.
     """
+    # Compiled once: parse_from_style matches this per line, and inline
+    # re.match pays the re-module cache lookup on every call.
+    _TREE_CHAR_RE = re.compile(r'^\s*[│├└]')
     @staticmethod
     def write_structure(structure: DirectoryStructure, **kwargs) -> str:
         """
@@ -17,6 +22,9 @@ class TreeStyle(BaseStyle):
 
         Args:
             structure (DirectoryStructure): The directory structure to write. The structure should be an instance of DirectoryStructure containing DirectoryItem instances.
+            **kwargs:
+                - ascii_only (bool): Render with ASCII connectors ('|-- ',
+                  '+-- ', '|   ') instead of the Unicode box-drawing set.
 
         Returns:
             str: The directory structure in a tree format.
@@ -44,35 +52,65 @@ class TreeStyle(BaseStyle):
                 └── sub_dir3/
                     └── file5.txt
         """
-        root_dir = kwargs.get('root_dir', '')
-        result = []
-        levels_has_next = []
-        for i, item in enumerate(structure.to_list()):
-            if item.level == 0:
-                result.append(f"{item.path}")
-                levels_has_next = []
+        # The render loop stays pure Python (the per-item work is all str
+        # objects), so keep the interpreter out of the way: resolve the item
+        # list and the write method once instead of per iteration. Writing
+        # fragments straight into a StringIO buffer skips the per-row line
+        # string that a list + '\n'.join would allocate.
+        # The box-drawing glyphs force the whole output into PEP 393 UCS-2
+        # storage; the ASCII set keeps it Latin-1, halving the buffer (and
+        # suits terminals and diffs that cannot render the Unicode set).
+        if kwargs.get('ascii_only', False):
+            pipe, mid_conn, last_conn = '|   ', '|-- ', '+-- '
+        else:
+            pipe, mid_conn, last_conn = '│   ', '├── ', '└── '
+        items = structure.to_list()
+        buf = io.StringIO()
+        write = buf.write
+        # One O(N) reverse pass over the cached levels column instead of an
+        # O(N) forward scan per item; the kernel never touches the items.
+        last_flags = utils.last_item_flags_from_levels(structure.levels)
+        # Structural directoryness, precomputed in one sweep over the levels
+        # column instead of peeking at the next item per row.
+        dir_flags = structure.dir_flags
+        # prefix_stack[L - 1] is the finished indent for rows at level L,
+        # maintained incrementally: each row extends its own indent by one
+        # connector for its children instead of rebuilding the whole O(level)
+        # prefix from scratch per row.
+        prefix_stack = ['']
+        for i, item in enumerate(items):
+            level = item.level
+            if level == 0:
+                write(item.path)
+                write('\n')
+                prefix_stack = ['']
                 continue
 
-            is_last = utils.is_last_item(structure.to_list(), i, item.level)
-            if len(levels_has_next) < item.level:
-                levels_has_next.extend([True] * (item.level - len(levels_has_next)))
-            levels_has_next[item.level - 1] = not is_last
-
-            indent = ''
-            for lvl in range(item.level - 1):
-                if levels_has_next[lvl]:
-                    indent += '│   '
-                else:
-                    indent += '    '
-            connector = '└── ' if is_last else '├── '
-
-            full_item_path = os.path.join(root_dir, item.path)
-            if os.path.isdir(full_item_path):
-                result.append(f"{indent}{connector}{item.name}/")
+            is_last = last_flags[i]
+            del prefix_stack[level:]
+            while len(prefix_stack) < level:
+                # Malformed jumps deeper than one level: assume open parents.
+                prefix_stack.append(prefix_stack[-1] + pipe)
+            indent = prefix_stack[level - 1]
+            prefix_stack.append(indent + ('    ' if is_last else pipe))
+
+            write(indent)
+            write(last_conn if is_last else mid_conn)
+            write(item.name)
+            # Decide directoryness from the structure itself — the type
+            # recorded during the walk, or failing that the precomputed
+            # structural flag — instead of a stat syscall per row.
+            meta_type = item.metadata.get('type')
+            if meta_type is not None:
+                is_dir = meta_type == 'directory'
             else:
-                result.append(f"{indent}{connector}{item.name}")
+                is_dir = dir_flags[i]
+            if is_dir:
+                write('/')
+            write('\n')
 
-        return '\n'.join(result)
+        result = buf.getvalue()
+        return result[:-1] if result else result
     
     @staticmethod
     def parse_from_style(tree_str: str) -> DirectoryStructure:
@@ -97,12 +135,13 @@ class TreeStyle(BaseStyle):
                 continue
 
             # Detect root line
-            if not root_dir_included and not re.match(r'^\s*[│├└]', line):
+            if not root_dir_included and not TreeStyle._TREE_CHAR_RE.match(line):
                 # This is the root directory
                 item_name = line.strip()
                 level = 0
                 current_path = item_name
-                structure.add_item(DirectoryItem(current_path, level, item_name))
+                structure.add_item(DirectoryItem(current_path, level, item_name,
+                                                 metadata={'type': 'directory'}))
                 parent_paths = [current_path]
                 root_dir_included = True
                 continue
@@ -115,21 +154,27 @@ class TreeStyle(BaseStyle):
             # Replace any remaining '│' with '\t' (in case of single '│' characters)
             line_clean = line_clean.replace('│', '\t')
 
-            # Match indent and name
-            indent_match = re.match(r'^(?P<indent>\t*)([├└][─]{2} )?(?P<name>.+)', line_clean)
-            if not indent_match:
-                continue  # Skip lines that don't match the pattern
-
-            indent_str = indent_match.group('indent')
-            name = indent_match.group('name').rstrip('/').strip()
+            # Extract indent and name. The indent unit is fixed (every level
+            # became one '\t' above), so counting tabs with a single C-level
+            # lstrip and slicing off the 4-char connector beats a regex match
+            # per line.
+            rest = line_clean.lstrip('\t')
+            level = len(line_clean) - len(rest) + 1  # +1 because root is level 0
+            if rest.startswith(('├── ', '└── ')):
+                rest = rest[4:]
+            name = rest.rstrip('/').strip()
+            if not name:
+                continue  # Skip lines with no item name
+            # Common basenames (__init__.py, README.md, ...) repeat across
+            # many directories; interning keeps one string object per unique
+            # name and makes later name-keyed lookups pointer comparisons.
+            name = sys.intern(name)
             is_folder = line.strip().endswith('/')
 
-            # Calculate level
-            level = len(indent_str) + 1  # +1 because root is level 0
-
-            # Update parent_paths
+            # Update parent_paths (truncate in place; a slice would copy the
+            # stack for every line)
             if level <= len(parent_paths):
-                parent_paths = parent_paths[:level]
+                del parent_paths[level:]
             else:
                 # Extend parent_paths if we're deeper than before
                 pass  # This case will naturally be handled when we append to parent_paths
@@ -140,7 +185,12 @@ class TreeStyle(BaseStyle):
             else:
                 current_path = name  # Should not happen, but added for safety
 
-            structure.add_item(DirectoryItem(current_path, level, name))
+            # Record directoryness from the trailing '/' the parse already
+            # decoded; otherwise the constructor falls back to an on-disk
+            # stat, which calls every path that does not exist a directory.
+            structure.add_item(DirectoryItem(
+                current_path, level, name,
+                metadata={'type': 'directory' if is_folder else 'file'}))
 
             if is_folder:
                 parent_paths.append(current_path)
@@ -155,35 +205,39 @@ class TreeStyle(BaseStyle):
         """
         items = structure.to_list()
         lines_and_items = []
-        levels_has_next = []
+        # One O(N) reverse pass over the cached levels column instead of an
+        # O(N) forward scan per item.
+        last_flags = utils.last_item_flags_from_levels(structure.levels)
+        # Same incremental prefix stack as write_structure: a row's indent is
+        # a single lookup instead of an O(level) rebuild.
+        prefix_stack = ['']
 
         for i, item in enumerate(items):
-            if item.level == 0:
-                line = f"{item.path}"
-                lines_and_items.append((line, item))
-                levels_has_next = []
+            level = item.level
+            if level == 0:
+                lines_and_items.append((item.path, item))
+                prefix_stack = ['']
                 continue
 
-            is_last = utils.is_last_item(items, i, item.level)
-            if len(levels_has_next) < item.level:
-                levels_has_next.extend([True] * (item.level - len(levels_has_next)))
-            levels_has_next[item.level - 1] = not is_last
-
-            indent = ''
-            for lvl in range(item.level - 1):
-                if levels_has_next[lvl]:
-                    indent += '│   '
-                else:
-                    indent += '    '
+            is_last = last_flags[i]
+            del prefix_stack[level:]
+            while len(prefix_stack) < level:
+                # Malformed jumps deeper than one level: assume open parents.
+                prefix_stack.append(prefix_stack[-1] + '│   ')
+            indent = prefix_stack[level - 1]
+            prefix_stack.append(indent + ('    ' if is_last else '│   '))
             connector = '└── ' if is_last else '├── '
 
-            # Decide if directory or file
-            # We'll check item.metadata['type'] == 'directory' or fallback to name with trailing slash
-            is_dir = ('type' in item.metadata and item.metadata['type'] == 'directory') or os.path.isdir(item.path)
+            # Decide if directory or file from the type recorded during the
+            # walk; only stat the path when no type was carried through.
+            meta_type = item.metadata.get('type')
+            is_dir = meta_type == 'directory' if meta_type is not None else os.path.isdir(item.path)
+            # Plain + concatenation of strings skips the per-row
+            # FORMAT_VALUE/BUILD_STRING bytecode an f-string compiles to.
             if is_dir:
-                line = f"{indent}{connector}{item.name}/"
+                line = indent + connector + item.name + '/'
             else:
-                line = f"{indent}{connector}{item.name}"
+                line = indent + connector + item.name
             lines_and_items.append((line, item))
 
         return lines_and_items
@@ -197,16 +251,20 @@ class TreeStyle(BaseStyle):
         if not lines_and_items:
             return ""
 
-        # Find max line length
-        max_line_length = max(len(line) for line, _ in lines_and_items)
-
-        result_lines = []
+        # One pass resolves each line's comment and tracks the alignment
+        # width as it goes, instead of a dedicated max() scan followed by a
+        # second metadata-lookup pass.
+        rows = []
+        max_line_length = 0
         for line, item in lines_and_items:
             short_summary = item.metadata.get('short_summary') if item.metadata else None
             if not short_summary:
                 short_summary = "No summary" if item.metadata and item.metadata.get('type') == 'file' else ""
-
-            spacing = " " * (max_line_length - len(line) + 2)  # 2 spaces before '#'
-            result_lines.append(f"{line}{spacing}# {short_summary}")
-
-        return "\n".join(result_lines)
\ No newline at end of file
+            line_len = len(line)
+            if line_len > max_line_length:
+                max_line_length = line_len
+            rows.append((line, line_len, short_summary))
+
+        pad_to = max_line_length + 2  # 2 spaces before '#'
+        return "\n".join(line + " " * (pad_to - line_len) + "# " + short_summary
+                         for line, line_len, short_summary in rows)
\ No newline at end of file
@@ -92,6 +92,25 @@ class SummaryCache:
         
         return f"{context_hash[:8]}_{content_hash[:24]}"
 
+    def get_content_key(self, content: str, model: str, max_words: int) -> str:
+        """
+        Generate a cache key for a content summary keyed by the content itself.
+
+        Keying on a hash of the content (rather than the file name) means
+        unchanged files skip the API entirely across runs, and identical
+        content shared by multiple files resolves to a single cache entry.
+
+        Args:
+            content (str): The content being summarized
+            model (str): The model used for summarization
+            max_words (int): The word limit requested for the summary
+
+        Returns:
+            str: Cache key for the content summary
+        """
+        digest = hashlib.blake2b(content.encode('utf-8'), digest_size=16).hexdigest()
+        return f"content_{digest}_{model}_{max_words}"
+
     def get_chunk_key(self, file_name: str, chunk_index: int, total_chunks: int) -> str:
         """
         Generate a consistent key for file chunks.
@@ -223,6 +242,29 @@ class SummaryCache:
         """
         return f"page_{page_index}_of_{total_pages}_{directory_structure.content_hash}"
 
+def _build_cache_key(self, func, args, kwargs):
+    """Build the cache key and display info shared by the sync/async cache decorators."""
+    # Get the first argument as our main object
+    obj = args[0] if args else None
+
+    # Get cache name and type using the cache manager, passing function name
+    cache_name, cache_type = self.cache.get_cache_name(obj, func.__name__)
+
+    # Generate cache key components
+    components = [
+        func.__name__,
+        obj.content_hash if hasattr(obj, 'content_hash') else '',
+        str(kwargs)
+    ]
+
+    # Generate cache key with type information
+    cache_key = self.cache.get_cache_key_with_type(
+        '_'.join(components),
+        getattr(self, 'cache_context', ''),
+        cache_type
+    )
+    return cache_key, cache_name, cache_type
+
 def cached_api_call(func):
     """Decorator to cache API calls with improved logging."""
     @functools.wraps(func)
@@ -231,26 +273,8 @@ def cached_api_call(func):
             return func(self, *args, **kwargs)
 
         try:
-            # Get the first argument as our main object
-            obj = args[0] if args else None
-            
-            # Get cache name and type using the cache manager, passing function name
-            cache_name, cache_type = self.cache.get_cache_name(obj, func.__name__)
-            
-            # Generate cache key components
-            components = [
-                func.__name__,
-                obj.content_hash if hasattr(obj, 'content_hash') else '',
-                str(kwargs)
-            ]
-            
-            # Generate cache key with type information
-            cache_key = self.cache.get_cache_key_with_type(
-                '_'.join(components),
-                getattr(self, 'cache_context', ''),
-                cache_type
-            )
-            
+            cache_key, cache_name, cache_type = _build_cache_key(self, func, args, kwargs)
+
             cached_result = self.cache.get(cache_key)
             if cached_result is not None:
                 logger.info(f"🔵 Using cached {cache_type} for {cache_name}")
@@ -272,5 +296,5 @@ def cached_api_call(func):
         except Exception as e:
             logger.error(f"Cache operation failed for {cache_name}: {str(e)}")
             return func(self, *args, **kwargs)
-            
+
     return wrapper
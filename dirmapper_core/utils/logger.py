@@ -1,3 +1,4 @@
+import asyncio
 import logging
 import threading
 import time
@@ -93,5 +94,27 @@ def log_periodically(custom_message: str, time_interval: int, include_time: bool
             logger.info(custom_message)
         time.sleep(time_interval)
 
+async def log_periodically_async(custom_message: str, time_interval: int, include_time: bool = True) -> None:
+    """
+    Coroutine counterpart of log_periodically for asyncio callers.
+
+    Run it as a task alongside API calls and cancel it when the work is done;
+    a single task can cover an entire asyncio.gather instead of one thread per
+    request.
+
+    Args:
+        custom_message (str): The message to log.
+        time_interval (int): The time interval in seconds between each log.
+        include_time (bool): Whether to include the time elapsed in the log message
+    """
+    start_time = time.time()
+    while True:
+        elapsed_time = int(time.time() - start_time)
+        if include_time:
+            logger.info(f"{custom_message} [{elapsed_time} sec]")
+        else:
+            logger.info(custom_message)
+        await asyncio.sleep(time_interval)
+
 stop_logging = threading.Event()
 logging_thread = threading.Thread(target=log_periodically)
@@ -17,19 +17,49 @@ def clean_json_keys(data: dict | list) -> dict:
         dict: The cleaned data structure.
     """
     if isinstance(data, dict):
-        new_dict = {}
-        for key, value in data.items():
-            # Remove tree drawing characters from the key
-            clean_key = key.replace('├── ', '').replace('└── ', '').replace('│   ', '').strip()
-            # Recursively clean the value
-            new_dict[clean_key] = clean_json_keys(value)
-        return new_dict
+        result = {}
     elif isinstance(data, list):
-        return [clean_json_keys(item) for item in data]
+        result = []
     else:
         # Base case: return the data as is
         return data
 
+    # Walk the nested structure iteratively with an explicit stack of
+    # (source, destination) pairs; recursion pays a Python frame per node
+    # and can overflow on very deep templates. JSON-decoded data only ever
+    # holds exact dicts and lists, so the per-value checks use identity
+    # (`type(x) is dict`), skipping isinstance's subclass/MRO walk.
+    stack = [(data, result)]
+    while stack:
+        src, dst = stack.pop()
+        if type(src) is dict:
+            for key, value in src.items():
+                # Remove tree drawing characters from the key
+                clean_key = key.replace('├── ', '').replace('└── ', '').replace('│   ', '').strip()
+                value_type = type(value)
+                if value_type is dict:
+                    dst[clean_key] = child = {}
+                    stack.append((value, child))
+                elif value_type is list:
+                    dst[clean_key] = child = []
+                    stack.append((value, child))
+                else:
+                    dst[clean_key] = value
+        else:
+            for value in src:
+                value_type = type(value)
+                if value_type is dict:
+                    child = {}
+                    dst.append(child)
+                    stack.append((value, child))
+                elif value_type is list:
+                    child = []
+                    dst.append(child)
+                    stack.append((value, child))
+                else:
+                    dst.append(value)
+    return result
+
 def get_package_version(package_name: str) -> str:
     """
     Get the version of the specified package.
@@ -98,6 +128,55 @@ def is_last_item(structure: List[DirectoryItem], index: int, current_level: int)
             break
     return True  # No more items at the same level
 
+def last_item_flags(structure: List[DirectoryItem]) -> List[bool]:
+    """
+    Compute is_last_item for every entry in one reverse pass.
+
+    Calling is_last_item per entry re-scans the remainder of the structure
+    each time, which is O(N^2) for large trees. A single backwards walk that
+    tracks which levels are still "open" in the suffix yields the same flags
+    in O(N).
+
+    Args:
+        structure (List[DirectoryItem]): The depth-preordered directory items.
+
+    Returns:
+        List[bool]: flags[i] is True when structure[i] is the last item at
+            its level within its parent, i.e. is_last_item(structure, i,
+            structure[i].level).
+    """
+    return last_item_flags_from_levels([item.level for item in structure])
+
+def last_item_flags_from_levels(levels: List[int]) -> List[bool]:
+    """
+    Integer-only kernel of last_item_flags operating on a plain levels column.
+
+    Separating the level arithmetic from the DirectoryItem objects lets
+    callers that already hold a cached levels list (DirectoryStructure.levels)
+    skip one attribute access per item, and keeps the kernel free of any
+    per-item Python object traffic.
+
+    Args:
+        levels (List[int]): The per-item levels in depth-preorder.
+
+    Returns:
+        List[bool]: flags[i] is True when entry i is the last at its level
+            within its parent.
+    """
+    n = len(levels)
+    flags = [True] * n
+    open_levels: List[int] = []  # strictly increasing levels seen in the suffix
+    for i in range(n - 1, -1, -1):
+        level = levels[i]
+        # A shallower entry closes every deeper sibling group after it.
+        while open_levels and open_levels[-1] > level:
+            open_levels.pop()
+        if open_levels and open_levels[-1] == level:
+            flags[i] = False
+        else:
+            open_levels.append(level)
+    return flags
+
 def is_directory(item):
     """
     Determine if the item is a directory.
@@ -160,10 +160,13 @@ class TemplateParser:
                 template['meta']['author'] = os.getlogin()
             if 'source' not in template['meta']:
                 template['meta']['source'] = 'dirmapper'
+            # One clock read for both fields; separate now() calls also made
+            # creation_date and last_modified differ by a few microseconds.
+            now_str = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
             if 'creation_date' not in template['meta']:
-                template['meta']['creation_date'] = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                template['meta']['creation_date'] = now_str
             if 'last_modified' not in template['meta']:
-                template['meta']['last_modified'] = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                template['meta']['last_modified'] = now_str
 
             # Validate the template
             self.validate_template(template)
@@ -294,6 +297,7 @@ class TemplateParser:
         )
 
         # Wrap the template_dict with the required meta
+        now_iso = datetime.datetime.now().isoformat()
         return {
             "meta": {
                 "version": "2.0",
@@ -303,8 +307,8 @@ class TemplateParser:
                 "last_modified_by": os.getlogin(),
                 "description": "No description provided",
                 "root_path": generic_structure.to_list()[0].path,
-                "creation_date": datetime.datetime.now().isoformat(),
-                "last_modified": datetime.datetime.now().isoformat()
+                "creation_date": now_iso,
+                "last_modified": now_iso
             },
             "template": template_json
         }
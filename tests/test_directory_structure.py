@@ -0,0 +1,40 @@
+import os
+
+from dirmapper_core.models.directory_item import DirectoryItem
+from dirmapper_core.models.directory_structure import DirectoryStructure
+
+def test_get_sub_items_matches_on_separator_boundary():
+    """
+    Test that get_sub_items only returns true descendants of the given path.
+
+    This test verifies that a path like '/xa/b' is not reported as a sub-item
+    of '/a': descendant matching must happen on the path-separator boundary,
+    not as a plain substring match.
+    """
+    sep = os.sep
+    structure = DirectoryStructure()
+    structure.add_item(DirectoryItem(sep + 'a', 0, 'a'))
+    structure.add_item(DirectoryItem(sep + 'a' + sep + 'b', 1, 'b'))
+    structure.add_item(DirectoryItem(sep + 'a' + sep + 'b' + sep + 'c.txt', 2, 'c.txt'))
+    structure.add_item(DirectoryItem(sep + 'xa', 0, 'xa'))
+    structure.add_item(DirectoryItem(sep + 'xa' + sep + 'b', 1, 'b'))
+
+    sub_paths = [item.path for item in structure.get_sub_items(sep + 'a')]
+
+    assert sub_paths == [
+        sep + 'a' + sep + 'b',
+        sep + 'a' + sep + 'b' + sep + 'c.txt',
+    ]
+
+def test_get_sub_items_with_trailing_separator():
+    """
+    Test that get_sub_items accepts a path with a trailing separator and
+    returns the same descendants as the bare path.
+    """
+    sep = os.sep
+    structure = DirectoryStructure()
+    structure.add_item(DirectoryItem(sep + 'a', 0, 'a'))
+    structure.add_item(DirectoryItem(sep + 'a' + sep + 'b', 1, 'b'))
+
+    assert [item.path for item in structure.get_sub_items(sep + 'a' + sep)] == \
+        [item.path for item in structure.get_sub_items(sep + 'a')]
@@ -0,0 +1,38 @@
+from dirmapper_core.styles.list_style import ListStyle
+
+def test_parse_preserves_dash_prefixed_names():
+    """
+    Test that ListStyle.parse_from_style keeps names that start with '-'.
+
+    This test verifies that only the fixed '- ' bullet prefix is removed from
+    each line: a charset-based strip would also eat leading dashes from names
+    like '-verbose.txt' or '--config'.
+    """
+    list_str = (
+        "/fake/proj\n"
+        "- -verbose.txt\n"
+        "- --config/\n"
+        "    - -flags.txt"
+    )
+
+    structure = ListStyle.parse_from_style(list_str)
+    names = [item.name for item in structure.to_list()]
+
+    assert names == ['/fake/proj', '-verbose.txt', '--config', '-flags.txt']
+
+def test_roundtrip_keeps_file_and_directory_markers():
+    """
+    Test that writing a parsed list reproduces the original string.
+
+    This test verifies that the parser records each item's type from the
+    structure itself, so files in a tree that does not exist on disk are not
+    rendered with a trailing '/'.
+    """
+    list_str = (
+        "/fake/proj\n"
+        "- setup.py\n"
+        "- src/\n"
+        "    - main.py"
+    )
+
+    assert ListStyle.write_structure(ListStyle.parse_from_style(list_str)) == list_str